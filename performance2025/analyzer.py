@@ -1,11 +1,13 @@
 """统计分析工具主程序"""
 import sys
-from PyQt6.QtWidgets import QApplication
-from ui.analyzer_window import AnalyzerWindow
 
 
 def main():
     """主函数"""
+    # 延迟导入 PyQt6/matplotlib，模块被导入时不加载 Qt
+    from PyQt6.QtWidgets import QApplication
+    from ui.analyzer_window import AnalyzerWindow
+    
     app = QApplication(sys.argv)
     window = AnalyzerWindow()
     window.show()
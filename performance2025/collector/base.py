@@ -1,11 +1,11 @@
 """基础采集器接口"""
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessInfo:
     """进程信息"""
     pid: int
@@ -15,14 +15,10 @@ class ProcessInfo:
     cpu_percent: float
     memory_mb: float
     # 其他操作系统特定的资源指标
-    extra_metrics: dict = None
-    
-    def __post_init__(self):
-        if self.extra_metrics is None:
-            self.extra_metrics = {}
+    extra_metrics: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemInfo:
     """系统信息"""
     timestamp: datetime
@@ -31,11 +27,7 @@ class SystemInfo:
     memory_used_mb: float
     memory_percent: float
     # 其他系统指标
-    extra_metrics: dict = None
-    
-    def __post_init__(self):
-        if self.extra_metrics is None:
-            self.extra_metrics = {}
+    extra_metrics: dict = field(default_factory=dict)
 
 
 class BaseCollector(ABC):
@@ -51,6 +43,22 @@ class BaseCollector(ABC):
         """快速获取进程列表（仅基本信息，用于显示列表）"""
         pass
     
+    def get_unique_process_names_fast(self) -> List[Tuple[str, str]]:
+        """
+        快速获取运行中的进程名（按进程名去重，不区分大小写，保留第一个）
+        
+        Returns:
+            按小写进程名排序的 (小写进程名, 进程名) 列表
+        """
+        names = self._list_process_names_fast()
+        keys = list(map(str.lower, names))
+        # 倒序建字典，使先出现的进程名覆盖后出现的
+        return sorted(dict(zip(reversed(keys), reversed(names))).items())
+    
+    def _list_process_names_fast(self) -> List[str]:
+        """列出所有运行进程的进程名（含重复），子类可提供不创建 ProcessInfo 的实现"""
+        return [proc.name for proc in self.get_process_list_fast()]
+    
     @abstractmethod
     def get_process_by_pid(self, pid: int) -> Optional[ProcessInfo]:
         """根据PID获取进程信息"""
@@ -66,3 +74,14 @@ class BaseCollector(ABC):
         """获取系统信息"""
         pass
 
+    
+    def prime_cpu(self, names: Iterable[str]) -> None:
+        """
+        为指定进程名（小写）的所有进程建立 CPU 使用率基准
+        
+        非阻塞方式计算的 CPU 使用率需要先采样一次，之后的采集才有值；
+        默认实现按进程名采集一次，只在子类跨采样复用 CPU 基准时有效，
+        子类应提供只建立基准的轻量实现
+        """
+        for name in names:
+            self.get_processes_by_name(name)
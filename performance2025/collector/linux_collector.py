@@ -1,84 +1,298 @@
 """Linux 平台数据采集器（预留实现）"""
+import os
+import time
+import functools
+import operator
 import psutil
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .base import BaseCollector, ProcessInfo, SystemInfo
 
 
+# 采集详细指标时预取的进程属性
+_DETAIL_ATTRS = ['pid', 'name', 'cmdline', 'username', 'memory_info']
+
+# 磁盘使用量缓存时间（秒），与默认记录间隔一致
+_DISK_USAGE_TTL = 5
+
+# get_all_processes 并发采集的线程数（工作以 /proc 读取为主，线程在 I/O 时释放 GIL）
+_COLLECT_WORKERS = 8
+
+# /proc/<pid>/comm 的最大长度（TASK_COMM_LEN - 1），达到该长度说明进程名可能被截断
+_COMM_MAX_LEN = 15
+
+# 按名称查找进程时读取 proc.info 中的进程名
+_get_name = operator.itemgetter('name')
+
+# /proc/<pid>/stat 单次读取的字节数（实际内容约 300 字节）
+_STAT_READ_SIZE = 1024
+
+# 最多保持打开的 /proc/<pid>/stat 文件描述符数量；
+# 实际上限还不超过 RLIMIT_NOFILE 软限制的 1/4，给界面、数据库和 psutil 自身留出余量
+_STAT_FD_CACHE_MAX = 256
+
+# 采集单个进程时可忽略的异常（进程已退出、无权限，或 /proc 读取失败如 EMFILE）
+_PROCESS_ERRORS = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, OSError)
+
+
+def _ttl_cache(seconds: float):
+    """按参数缓存函数结果，超过 seconds 秒后重新计算"""
+    def decorator(func):
+        cache = {}
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is None or now - entry[0] >= seconds:
+                entry = (now, func(*args))
+                cache[args] = entry
+            return entry[1]
+        return wrapper
+    return decorator
+
+
+def _read_proc_file(path: str, size: int) -> bytes:
+    """用 os.open/os.read 读取 /proc 下的小文件，比带缓冲的 open() 开销更小"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _list_pids() -> List[int]:
+    """列出 /proc 下的所有 PID（只需要目录名，listdir 不创建 DirEntry 对象，比 scandir 更省）"""
+    return [int(name) for name in os.listdir('/proc') if name.isdigit()]
+
+
+def _parse_cpu_ticks(stat: bytes) -> int:
+    """从 /proc/<pid>/stat 内容解析进程累计 CPU 时间（utime + stime，时钟滴答数）"""
+    # 进程名可能包含空格和括号，从最后一个 ')' 之后开始按空格切分；
+    # 切分后下标 11、12 对应第 14、15 个字段 utime、stime
+    fields = stat[stat.rindex(b')') + 2:].split(b' ', 13)
+    return int(fields[11]) + int(fields[12])
+
+
+@_ttl_cache(_DISK_USAGE_TTL)
+def _disk_usage(path: str):
+    """磁盘使用量（statvfs），两次采样间变化很小，按 TTL 缓存"""
+    return psutil.disk_usage(path)
+
+
 class LinuxCollector(BaseCollector):
     """Linux 平台数据采集器实现（预留）"""
     
+    def __init__(self):
+        # get_all_processes 使用的进程对象缓存 {pid: psutil.Process}
+        self._proc_cache: Dict[int, psutil.Process] = {}
+        # 跨采样周期保持打开的 /proc/<pid>/stat 文件描述符 {pid: fd}，
+        # 每次采样用 os.pread 从头读取，省去 open/close；
+        # 只缓存按进程名反复采样的进程，数量上限 _stat_fd_limit
+        self._stat_fds: Dict[int, int] = {}
+        import resource
+        soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+        self._stat_fd_limit = (
+            _STAT_FD_CACHE_MAX if soft_limit == resource.RLIM_INFINITY
+            else min(_STAT_FD_CACHE_MAX, soft_limit // 4)
+        )
+        # 上一次采样的 CPU 时间 {pid: (累计CPU秒数, time.monotonic())}
+        self._cpu_times: Dict[int, Tuple[float, float]] = {}
+        # /proc/<pid>/stat 中 CPU 时间的单位（每秒时钟滴答数）；
+        # os.sysconf 只在类 Unix 系统上存在，不在模块加载时读取，保证 Windows 上可以导入本模块
+        self._clk_tck = os.sysconf('SC_CLK_TCK')
+        # CPU 核数在运行期间不会变化，创建采集器时读取一次（同样不放在模块加载时）
+        self._cpu_count = psutil.cpu_count()
+    
     def get_process_list_fast(self) -> List[ProcessInfo]:
         """快速获取进程列表（仅基本信息，用于显示列表）"""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name']):
+        return [
+            ProcessInfo(
+                pid=pid,
+                name=name,
+                command_line='',
+                user='N/A',
+                cpu_percent=0.0,
+                memory_mb=0.0,
+                extra_metrics={}
+            )
+            for pid, name in self._fast_scan()
+        ]
+    
+    def _list_process_names_fast(self) -> List[str]:
+        """列出所有运行进程的进程名（含重复），只读取 /proc/<pid>/comm"""
+        return [name for _, name in self._fast_scan()]
+    
+    def _fast_scan(self) -> List[Tuple[int, str]]:
+        """
+        直接遍历 /proc 读取 (pid, 进程名)，不创建 psutil.Process 对象
+        
+        进程名取自 /proc/<pid>/comm；comm 被内核截断为 15 个字符时，
+        与 psutil 一致地用 cmdline 第一个参数的文件名补全。
+        """
+        result = []
+        for pid in _list_pids():
             try:
-                pinfo = proc.info
-                process_info = ProcessInfo(
-                    pid=pinfo['pid'],
-                    name=pinfo['name'],
-                    command_line='',
-                    user='N/A',
-                    cpu_percent=0.0,
-                    memory_mb=0.0,
-                    extra_metrics={}
-                )
-                processes.append(process_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                name = _read_proc_file(f'/proc/{pid}/comm', 64).rstrip(b'\n').decode('utf-8', 'replace')
+                if len(name) >= _COMM_MAX_LEN:
+                    cmdline = _read_proc_file(f'/proc/{pid}/cmdline', 4096)
+                    if cmdline:
+                        extended = os.path.basename(cmdline.split(b'\0', 1)[0].decode('utf-8', 'replace'))
+                        if extended.startswith(name):
+                            name = extended
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                # 进程已退出或无权限
                 continue
-        return processes
+            result.append((pid, name))
+        return result
     
     def get_all_processes(self) -> List[ProcessInfo]:
-        """获取所有进程信息"""
+        """获取所有进程信息（多线程并发读取 /proc，重叠各进程的 I/O 等待）"""
+        pids = _list_pids()
+        with ThreadPoolExecutor(max_workers=_COLLECT_WORKERS) as executor:
+            results = list(executor.map(self._collect_one, pids))
+        # 清理已退出进程的缓存
+        alive = set(pids)
+        self._proc_cache = {pid: proc for pid, proc in self._proc_cache.items() if pid in alive}
+        self._prune_stat_cache(alive)
+        return [info for info in results if info is not None]
+    
+    def _collect_one(self, pid: int) -> Optional[ProcessInfo]:
+        """采集单个进程的详细指标（在线程池中执行）"""
+        try:
+            # 复用 Process 对象，保留 cpu_percent 的计算基准
+            proc = self._proc_cache.get(pid)
+            if proc is None:
+                proc = self._proc_cache[pid] = psutil.Process(pid)
+            return self._build_process_info(proc)
+        except _PROCESS_ERRORS:
+            self._proc_cache.pop(pid, None)
+            return None
+    
+    def get_process_by_pid(self, pid: int) -> Optional[ProcessInfo]:
+        """根据PID获取进程信息"""
+        try:
+            return self._build_process_info(psutil.Process(pid))
+        except _PROCESS_ERRORS:
+            return None
+    
+    def get_processes_by_name(self, name: str) -> List[ProcessInfo]:
+        """根据进程名获取进程信息（不区分大小写）"""
         processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'username', 'cpu_percent', 'memory_info']):
+        alive = set()
+        # 与监控列表的小写进程名（str.lower）保持同一种规范化，
+        # 不同写法的监控名不会匹配到同一个进程而在同一批次中重复写入
+        name_lower = name.lower()
+        get_name = _get_name
+        # 单次遍历：只预取进程名做过滤，匹配的进程再在同一个 Process 对象上
+        # （oneshot 内）采集详细指标，不再通过 get_process_by_pid 重新打开进程
+        for proc in psutil.process_iter(['pid', 'name']):
+            alive.add(proc.pid)
             try:
-                pinfo = proc.info
-                cpu_percent = proc.cpu_percent(interval=None)  # 非阻塞模式
-                
-                memory_info = pinfo.get('memory_info')
-                memory_mb = memory_info.rss / 1024 / 1024 if memory_info else 0
-                
-                cmdline = pinfo.get('cmdline', [])
-                command_line = ' '.join(cmdline) if cmdline else ''
-                
-                username = pinfo.get('username', 'N/A')
-                
-                process_info = ProcessInfo(
-                    pid=pinfo['pid'],
-                    name=pinfo['name'],
-                    command_line=command_line,
-                    user=username or 'N/A',
-                    cpu_percent=cpu_percent,
-                    memory_mb=memory_mb,
-                    extra_metrics={
-                        'num_threads': proc.num_threads(),
-                        'num_fds': proc.num_fds() if hasattr(proc, 'num_fds') else 0,
-                        'io_read_bytes': proc.io_counters().read_bytes if proc.io_counters() else 0,
-                        'io_write_bytes': proc.io_counters().write_bytes if proc.io_counters() else 0,
-                    }
-                )
-                processes.append(process_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                if (get_name(proc.info) or '').lower() == name_lower:
+                    # 监控进程每次采样都会读取，保持 stat 文件描述符打开
+                    processes.append(self._build_process_info(proc, cache_fd=True))
+            except _PROCESS_ERRORS:
                 continue
+        self._prune_stat_cache(alive)
         return processes
     
-    def get_process_by_pid(self, pid: int) -> Optional[ProcessInfo]:
-        """根据PID获取进程信息"""
+    def prime_cpu(self, names: Iterable[str]) -> None:
+        """为指定进程名（小写）的所有进程建立 CPU 使用率基准（一次遍历，只读取 /proc/<pid>/stat）"""
+        names_lower = {name.lower() for name in names}
+        alive = set()
+        get_name = _get_name
+        for proc in psutil.process_iter(['pid', 'name']):
+            alive.add(proc.pid)
+            if (get_name(proc.info) or '').lower() in names_lower:
+                try:
+                    self._process_cpu_percent(proc.pid, cache_fd=True)
+                except _PROCESS_ERRORS:
+                    continue
+        self._prune_stat_cache(alive)
+    
+    def _read_stat(self, pid: int, cache_fd: bool = False) -> bytes:
+        """
+        读取 /proc/<pid>/stat，复用已打开的文件描述符
+        
+        Args:
+            pid: 进程ID
+            cache_fd: 是否保持文件描述符打开供下次采样复用（缓存已满时不再缓存）
+        """
+        fd = self._stat_fds.get(pid)
+        if fd is not None:
+            try:
+                return os.pread(fd, _STAT_READ_SIZE, 0)
+            except ProcessLookupError:
+                # 原进程已退出（PID 可能已被新进程复用），关闭旧描述符后重新打开
+                self._close_stat_fd(pid)
+        path = f'/proc/{pid}/stat'
         try:
-            proc = psutil.Process(pid)
-            cpu_percent = proc.cpu_percent(interval=None)  # 非阻塞模式
-            memory_info = proc.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
+            if not cache_fd or len(self._stat_fds) >= self._stat_fd_limit:
+                return _read_proc_file(path, _STAT_READ_SIZE)
+            fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except (FileNotFoundError, ProcessLookupError):
+            raise psutil.NoSuchProcess(pid)
+        self._stat_fds[pid] = fd
+        return os.pread(fd, _STAT_READ_SIZE, 0)
+    
+    def _close_stat_fd(self, pid: int) -> None:
+        """关闭进程的 stat 文件描述符，并丢弃其 CPU 时间基准"""
+        fd = self._stat_fds.pop(pid, None)
+        if fd is not None:
+            os.close(fd)
+        self._cpu_times.pop(pid, None)
+    
+    def _prune_stat_cache(self, alive: set) -> None:
+        """关闭已退出进程的 stat 文件描述符，并丢弃其 CPU 时间基准"""
+        for pid in [pid for pid in self._cpu_times.keys() | self._stat_fds.keys() if pid not in alive]:
+            self._close_stat_fd(pid)
+    
+    def _process_cpu_percent(self, pid: int, cache_fd: bool = False) -> float:
+        """
+        计算进程自上次采样以来的 CPU 使用率（与 psutil cpu_percent 口径一致，多核可超过 100）
+        
+        首次采样只建立基准，返回 0.0
+        """
+        try:
+            cpu_seconds = _parse_cpu_ticks(self._read_stat(pid, cache_fd)) / self._clk_tck
+        except ProcessLookupError:
+            self._close_stat_fd(pid)
+            raise psutil.NoSuchProcess(pid)
+        now = time.monotonic()
+        previous = self._cpu_times.get(pid)
+        self._cpu_times[pid] = (cpu_seconds, now)
+        if previous is None or now <= previous[1]:
+            return 0.0
+        return (cpu_seconds - previous[0]) / (now - previous[1]) * 100
+    
+    def _build_process_info(self, proc: psutil.Process, cache_fd: bool = False) -> ProcessInfo:
+        """
+        采集单个进程的详细指标
+        
+        Args:
+            proc: psutil 进程对象
+            cache_fd: 是否保持 /proc/<pid>/stat 文件描述符打开（只用于反复采样的监控进程）
+        """
+        # oneshot 缓存 /proc/<pid>/stat 等文件的读取结果，避免每个指标重复打开
+        with proc.oneshot():
+            pinfo = proc.as_dict(_DETAIL_ATTRS)
+            cpu_percent = self._process_cpu_percent(proc.pid, cache_fd)  # 非阻塞，基于上次采样的差值
             
-            cmdline = proc.cmdline()
+            memory_info = pinfo.get('memory_info')
+            memory_mb = memory_info.rss / 1024 / 1024 if memory_info else 0
+            
+            cmdline = pinfo.get('cmdline', [])
             command_line = ' '.join(cmdline) if cmdline else ''
             
-            username = proc.username()
+            username = pinfo.get('username', 'N/A')
+            
+            io = proc.io_counters()
             
             return ProcessInfo(
-                pid=pid,
-                name=proc.name(),
+                pid=pinfo['pid'],
+                name=pinfo['name'],
                 command_line=command_line,
                 user=username or 'N/A',
                 cpu_percent=cpu_percent,
@@ -86,31 +300,18 @@ class LinuxCollector(BaseCollector):
                 extra_metrics={
                     'num_threads': proc.num_threads(),
                     'num_fds': proc.num_fds() if hasattr(proc, 'num_fds') else 0,
-                    'io_read_bytes': proc.io_counters().read_bytes if proc.io_counters() else 0,
-                    'io_write_bytes': proc.io_counters().write_bytes if proc.io_counters() else 0,
+                    'io_read_bytes': io.read_bytes if io else 0,
+                    'io_write_bytes': io.write_bytes if io else 0,
                 }
             )
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            return None
-    
-    def get_processes_by_name(self, name: str) -> List[ProcessInfo]:
-        """根据进程名获取进程信息（不区分大小写）"""
-        processes = []
-        name_lower = name.lower()
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if proc.info['name'].lower() == name_lower:
-                    process_info = self.get_process_by_pid(proc.info['pid'])
-                    if process_info:
-                        processes.append(process_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-        return processes
     
     def get_system_info(self) -> SystemInfo:
         """获取系统信息"""
         cpu_percent = psutil.cpu_percent(interval=None)  # 非阻塞模式
         memory = psutil.virtual_memory()
+        freq = psutil.cpu_freq()
+        du = _disk_usage('/')
+        nio = psutil.net_io_counters()
         
         return SystemInfo(
             timestamp=datetime.now(),
@@ -119,18 +320,17 @@ class LinuxCollector(BaseCollector):
             memory_used_mb=memory.used / 1024 / 1024,
             memory_percent=memory.percent,
             extra_metrics={
-                'cpu_count': psutil.cpu_count(),
-                'cpu_freq': psutil.cpu_freq().current if psutil.cpu_freq() else 0,
+                'cpu_count': self._cpu_count,
+                'cpu_freq': freq.current if freq else 0,
                 'load_avg': psutil.getloadavg(),
                 'disk_usage': {
-                    'total': psutil.disk_usage('/').total / 1024 / 1024 / 1024,  # GB
-                    'used': psutil.disk_usage('/').used / 1024 / 1024 / 1024,
-                    'free': psutil.disk_usage('/').free / 1024 / 1024 / 1024,
+                    'total': du.total / 1024 / 1024 / 1024,  # GB
+                    'used': du.used / 1024 / 1024 / 1024,
+                    'free': du.free / 1024 / 1024 / 1024,
                 },
                 'network_io': {
-                    'bytes_sent': psutil.net_io_counters().bytes_sent if psutil.net_io_counters() else 0,
-                    'bytes_recv': psutil.net_io_counters().bytes_recv if psutil.net_io_counters() else 0,
+                    'bytes_sent': nio.bytes_sent if nio else 0,
+                    'bytes_recv': nio.bytes_recv if nio else 0,
                 }
             }
         )
-
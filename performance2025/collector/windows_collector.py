@@ -1,6 +1,6 @@
 """Windows 平台数据采集器"""
 import psutil
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from datetime import datetime
 from .base import BaseCollector, ProcessInfo, SystemInfo
 
@@ -70,47 +70,65 @@ class WindowsCollector(BaseCollector):
     def get_process_by_pid(self, pid: int) -> Optional[ProcessInfo]:
         """根据PID获取进程信息"""
         try:
-            proc = psutil.Process(pid)
-            cpu_percent = proc.cpu_percent(interval=None)  # 非阻塞模式
-            memory_info = proc.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-            
-            cmdline = proc.cmdline()
-            command_line = ' '.join(cmdline) if cmdline else ''
-            
-            username = proc.username()
-            
-            return ProcessInfo(
-                pid=pid,
-                name=proc.name(),
-                command_line=command_line,
-                user=username or 'N/A',
-                cpu_percent=cpu_percent,
-                memory_mb=memory_mb,
-                extra_metrics={
-                    'num_threads': proc.num_threads(),
-                    'num_handles': proc.num_handles() if hasattr(proc, 'num_handles') else 0,
-                    'io_read_bytes': proc.io_counters().read_bytes if proc.io_counters() else 0,
-                    'io_write_bytes': proc.io_counters().write_bytes if proc.io_counters() else 0,
-                }
-            )
+            return self._build_process_info(psutil.Process(pid))
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             return None
     
+    def _build_process_info(self, proc: psutil.Process) -> ProcessInfo:
+        """
+        采集单个进程的详细指标
+        
+        CPU 使用率基于该 Process 对象上一次 cpu_percent 调用的差值，
+        需要跨采样复用同一个对象才有值
+        """
+        cpu_percent = proc.cpu_percent(interval=None)  # 非阻塞模式
+        memory_info = proc.memory_info()
+        memory_mb = memory_info.rss / 1024 / 1024
+        
+        cmdline = proc.cmdline()
+        command_line = ' '.join(cmdline) if cmdline else ''
+        
+        username = proc.username()
+        
+        return ProcessInfo(
+            pid=proc.pid,
+            name=proc.name(),
+            command_line=command_line,
+            user=username or 'N/A',
+            cpu_percent=cpu_percent,
+            memory_mb=memory_mb,
+            extra_metrics={
+                'num_threads': proc.num_threads(),
+                'num_handles': proc.num_handles() if hasattr(proc, 'num_handles') else 0,
+                'io_read_bytes': proc.io_counters().read_bytes if proc.io_counters() else 0,
+                'io_write_bytes': proc.io_counters().write_bytes if proc.io_counters() else 0,
+            }
+        )
+    
     def get_processes_by_name(self, name: str) -> List[ProcessInfo]:
         """根据进程名获取进程信息（不区分大小写）"""
         processes = []
         name_lower = name.lower()
+        # process_iter 按 PID 缓存 Process 对象，直接在其上采集，
+        # 使 cpu_percent 的计算基准跨采样保留
         for proc in psutil.process_iter(['pid', 'name']):
             try:
-                if proc.info['name'].lower() == name_lower:
-                    process_info = self.get_process_by_pid(proc.info['pid'])
-                    if process_info:
-                        processes.append(process_info)
+                if (proc.info['name'] or '').lower() == name_lower:
+                    processes.append(self._build_process_info(proc))
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
         return processes
     
+    def prime_cpu(self, names: Iterable[str]) -> None:
+        """为指定进程名（小写）的所有进程建立 CPU 使用率基准（一次遍历，只调用 cpu_percent）"""
+        names_lower = {name.lower() for name in names}
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                if (proc.info['name'] or '').lower() in names_lower:
+                    proc.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+    
     def get_system_info(self) -> SystemInfo:
         """获取系统信息"""
         cpu_percent = psutil.cpu_percent(interval=None)  # 非阻塞模式
@@ -1,8 +1,9 @@
 """配置文件管理器"""
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 class ConfigManager:
@@ -33,6 +34,8 @@ class ConfigManager:
             self.config_path = Path(config_path)
         
         self.config: Dict[str, Any] = {}
+        # 点号分隔键的拆分结果缓存 {key: (k1, k2, ...)}
+        self._key_cache: Dict[str, Tuple[str, ...]] = {}
         self.load_config()
     
     def load_config(self) -> None:
@@ -53,42 +56,48 @@ class ConfigManager:
             self.save_config()
     
     def _merge_defaults(self) -> None:
-        """合并默认配置，确保所有键都存在"""
-        def merge_dict(default: dict, current: dict) -> dict:
-            result = default.copy()
-            for key, value in current.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = merge_dict(result[key], value)
-                else:
-                    result[key] = value
-            return result
-        
-        self.config = merge_dict(self.DEFAULT_CONFIG, self.config)
+        """合并默认配置，确保所有键都存在（原地补齐缺失键）"""
+        stack = [(self.DEFAULT_CONFIG, self.config)]
+        while stack:
+            default, current = stack.pop()
+            for key, value in default.items():
+                if key not in current:
+                    # 深拷贝，避免配置与 DEFAULT_CONFIG 共享可变对象
+                    current[key] = copy.deepcopy(value)
+                elif isinstance(value, dict) and isinstance(current[key], dict):
+                    stack.append((value, current[key]))
     
     def save_config(self) -> None:
         """保存配置文件"""
         try:
+            new_bytes = json.dumps(self.config, indent=4, ensure_ascii=False).encode('utf-8')
+            # 内容未变化时不写文件
+            if self.config_path.exists() and self.config_path.read_bytes() == new_bytes:
+                return
             # 确保目录存在（如果父目录不存在，创建它）
             parent_dir = self.config_path.parent
             if parent_dir and not parent_dir.exists():
                 parent_dir.mkdir(parents=True, exist_ok=True)
             # 使用临时文件写入，避免文件锁定问题
-            import tempfile
-            import shutil
             temp_path = str(self.config_path) + '.tmp'
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            # 原子性替换
-            if self.config_path.exists():
-                self.config_path.unlink()
-            shutil.move(temp_path, self.config_path)
+            with open(temp_path, 'wb') as f:
+                f.write(new_bytes)
+            # 原子性替换（POSIX 和 Windows 均为单次系统调用，不存在配置文件缺失的窗口期）
+            os.replace(temp_path, self.config_path)
         except Exception as e:
             print(f"保存配置文件失败: {e}")
             # 如果保存失败，不影响程序运行，只是使用内存中的配置
     
+    def _split_key(self, key: str) -> Tuple[str, ...]:
+        """拆分点号分隔的键（结果缓存）"""
+        keys = self._key_cache.get(key)
+        if keys is None:
+            keys = self._key_cache[key] = tuple(key.split('.'))
+        return keys
+    
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值，支持点号分隔的嵌套键"""
-        keys = key.split('.')
+        keys = self._split_key(key)
         value = self.config
         for k in keys:
             if isinstance(value, dict) and k in value:
@@ -99,7 +108,7 @@ class ConfigManager:
     
     def set(self, key: str, value: Any) -> None:
         """设置配置值，支持点号分隔的嵌套键"""
-        keys = key.split('.')
+        keys = self._split_key(key)
         config = self.config
         for k in keys[:-1]:
             if k not in config:
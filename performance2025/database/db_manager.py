@@ -1,52 +1,141 @@
 """数据库管理器"""
 import sqlite3
 import json
+import threading
+import time
+import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 from collector.base import ProcessInfo, SystemInfo
 
 
+# 单独成列存储的进程指标（分析工具高频使用），其余指标保留在 extra_metrics JSON 中
+# num_fds 列在 Windows 上存储句柄数（num_handles）
+_HOT_PROCESS_METRICS = ('num_threads', 'num_fds', 'io_read_bytes', 'io_write_bytes')
+
+# 旧版本数据库的时间戳为本地时间 ISO 字符串（YYYY-MM-DDTHH:MM:SS[.ffffff]），
+# 读取时在 SQL 中换算为纳秒时间戳：整数秒 + 第 21 位起的微秒部分
+_LEGACY_TS_EXPR = (
+    "(CAST(strftime('%s', {col}, 'utc') AS INTEGER) * 1000000000"
+    " + CAST(substr({col}, 21, 6) AS INTEGER) * 1000)"
+)
+
+# 旧版本数据库没有高频指标列时，只读打开的读取表达式（直接从 extra_metrics JSON 中提取）
+_LEGACY_HOT_METRIC_EXPRS = {
+    'num_threads': "json_extract(extra_metrics, '$.num_threads')",
+    'num_fds': "COALESCE(json_extract(extra_metrics, '$.num_fds'),"
+               " json_extract(extra_metrics, '$.num_handles'))",
+    'io_read_bytes': "json_extract(extra_metrics, '$.io_read_bytes')",
+    'io_write_bytes': "json_extract(extra_metrics, '$.io_write_bytes')",
+}
+
+# 时间范围参数：纳秒时间戳、datetime 或 ISO 格式字符串
+TimeValue = Union[int, datetime, str]
+
+
+def _datetime_to_ns(dt: datetime) -> int:
+    """datetime 转换为纳秒时间戳（Unix epoch）"""
+    return int(dt.timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
+
+def _dumps_metrics(metrics: Optional[dict]) -> str:
+    """序列化 extra_metrics（紧凑分隔符，空字典直接返回常量）"""
+    if not metrics:
+        return '{}'
+    return json.dumps(metrics, separators=(',', ':'))
+
+
+def _loads_metrics(text: Optional[str]) -> dict:
+    """解析 extra_metrics JSON，格式错误时返回空字典"""
+    if not text:
+        return {}
+    try:
+        return json.loads(text)
+    except ValueError:
+        return {}
+
+
 class DatabaseManager:
     """SQLite3 数据库管理器"""
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, read_only: bool = False):
         """
         初始化数据库管理器
         
         Args:
             db_path: 数据库文件路径
+            read_only: 只读打开（分析工具查看已有记录）：不建表、不迁移旧版本数据、
+                不修改日志模式，文件内容保持不变
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_database()
+        self.read_only = read_only
+        if not read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 长连接：监测循环每次写入不再重复 connect/close；
+        # 允许跨线程使用（监测线程写入），由锁保证串行访问
+        self._conn = self._connect()
+        self._lock = threading.Lock()
+        if read_only:
+            self._inspect_schema()
+        else:
+            self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """创建数据库连接并设置 PRAGMA"""
+        if self.read_only:
+            conn = sqlite3.connect(f'{self.db_path.as_uri()}?mode=ro', uri=True,
+                                   check_same_thread=False, cached_statements=256)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            # WAL：监测写入与分析读取互不阻塞；NORMAL 同步在 WAL 下只在检查点时 fsync
+            # （日志模式会写入文件，只读打开时保持文件原有模式）
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA wal_autocheckpoint=1000')
+        # 以下只影响本连接，不修改文件
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')  # 64 MiB
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MiB
+        return conn
+    
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
     
     def _init_database(self) -> None:
         """初始化数据库表结构"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         # 创建进程信息表
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS processes (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,  -- 纳秒时间戳
                 pid INTEGER NOT NULL,
                 name TEXT NOT NULL,
                 command_line TEXT,
                 user TEXT,
                 cpu_percent REAL,
                 memory_mb REAL,
+                num_threads INTEGER,
+                num_fds INTEGER,
+                io_read_bytes INTEGER,
+                io_write_bytes INTEGER,
                 extra_metrics TEXT,
                 UNIQUE(timestamp, pid)
             )
         ''')
+        self._migrate_hot_metric_columns(cursor)
+        self._inspect_schema()
         
         # 创建系统信息表
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS system_info (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL UNIQUE,
+                timestamp INTEGER NOT NULL UNIQUE,  -- 纳秒时间戳
                 cpu_percent REAL,
                 memory_total_mb REAL,
                 memory_used_mb REAL,
@@ -55,84 +144,226 @@ class DatabaseManager:
             )
         ''')
         
+        # 旧版本数据库没有复合索引，创建后需要补充统计信息
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_proc_pid_ts'")
+        has_composite_index = cursor.fetchone() is not None
+        
         # 创建索引以提高查询性能
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_processes_timestamp ON processes(timestamp)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_processes_pid ON processes(pid)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_processes_name ON processes(name)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_system_info_timestamp ON system_info(timestamp)')
+        # (pid/name, timestamp) 复合索引：按进程过滤后结果已按时间排序，无需额外排序
+        # 按时间的查询由 UNIQUE(timestamp, ...) 自动创建的索引覆盖，不再单独建 timestamp 索引，
+        # 每插入一行少维护一棵 B 树
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_proc_name_ts ON processes(name, timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_proc_pid_ts ON processes(pid, timestamp)')
+        cursor.execute('DROP INDEX IF EXISTS idx_processes_timestamp')
+        cursor.execute('DROP INDEX IF EXISTS idx_processes_pid')
+        cursor.execute('DROP INDEX IF EXISTS idx_processes_name')
+        cursor.execute('DROP INDEX IF EXISTS idx_system_info_timestamp')
         
         conn.commit()
-        conn.close()
+        
+        if not has_composite_index:
+            cursor.execute('SELECT EXISTS (SELECT 1 FROM processes)')
+            if cursor.fetchone()[0]:
+                # 采样分析，避免大数据库全表扫描
+                cursor.execute('PRAGMA analysis_limit=1000')
+                cursor.execute('ANALYZE')
+                conn.commit()
+    
+    def _inspect_schema(self) -> None:
+        """根据 processes 表结构确定时间戳和高频指标的读取方式"""
+        columns = {row[1]: row[2] for row in self._conn.execute('PRAGMA table_info(processes)')}
+        # 旧版本数据库的 timestamp 列为 TEXT（ISO 字符串），读取时需要换算
+        self._legacy_timestamps = columns.get('timestamp', '').upper() == 'TEXT'
+        # 高频指标列（只读打开未迁移的旧版本数据库时，缺失的列从 JSON 中提取；
+        # json_valid 防止个别损坏的 JSON 让 json_extract 报错导致整个查询失败）
+        self._hot_metric_columns = ', '.join(
+            column if column in columns
+            else f'CASE WHEN json_valid(extra_metrics) THEN {_LEGACY_HOT_METRIC_EXPRS[column]} END'
+            for column in _HOT_PROCESS_METRICS
+        )
+    
+    def _migrate_hot_metric_columns(self, cursor: sqlite3.Cursor) -> None:
+        """旧版本数据库：补充高频指标列，并从 extra_metrics JSON 中回填"""
+        cursor.execute('PRAGMA table_info(processes)')
+        columns = {row[1] for row in cursor.fetchall()}
+        missing = [c for c in _HOT_PROCESS_METRICS if c not in columns]
+        if not missing:
+            return
+        
+        for column in missing:
+            cursor.execute(f'ALTER TABLE processes ADD COLUMN {column} INTEGER')
+        cursor.execute('''
+            UPDATE processes SET
+                num_threads = json_extract(extra_metrics, '$.num_threads'),
+                num_fds = COALESCE(json_extract(extra_metrics, '$.num_fds'),
+                                   json_extract(extra_metrics, '$.num_handles')),
+                io_read_bytes = json_extract(extra_metrics, '$.io_read_bytes'),
+                io_write_bytes = json_extract(extra_metrics, '$.io_write_bytes')
+            WHERE json_valid(extra_metrics)
+        ''')
+    
+    def _ts_column(self, col: str = 'timestamp') -> str:
+        """查询结果中的时间戳列表达式（统一为纳秒时间戳）"""
+        return _LEGACY_TS_EXPR.format(col=col) if self._legacy_timestamps else col
+    
+    def _ts_param(self, value: TimeValue) -> Union[int, str]:
+        """将时间范围参数转换为与 timestamp 列相同的类型，以便走索引比较"""
+        if self._legacy_timestamps:
+            if isinstance(value, int):
+                return datetime.fromtimestamp(value / 1e9).isoformat()
+            if isinstance(value, datetime):
+                return value.isoformat()
+            return value
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime):
+            return _datetime_to_ns(value)
+        return value
     
     def insert_process_info(self, process_info: ProcessInfo) -> None:
         """插入进程信息"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        timestamp = datetime.now().isoformat()
-        extra_metrics_json = json.dumps(process_info.extra_metrics) if process_info.extra_metrics else '{}'
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO processes 
-            (timestamp, pid, name, command_line, user, cpu_percent, memory_mb, extra_metrics)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            timestamp,
-            process_info.pid,
-            process_info.name,
-            process_info.command_line,
-            process_info.user,
-            process_info.cpu_percent,
-            process_info.memory_mb,
-            extra_metrics_json
-        ))
+        self.insert_process_infos([process_info], time.time_ns())
+    
+    def insert_process_infos(self, infos: List[ProcessInfo], timestamp: int) -> None:
+        """
+        批量插入同一次采样的进程信息（单个事务）
         
-        conn.commit()
-        conn.close()
+        Args:
+            infos: 进程信息列表
+            timestamp: 本次采样的时间戳（纳秒，time.time_ns()）
+        """
+        rows = []
+        for p in infos:
+            metrics = p.extra_metrics or {}
+            tail_metrics = {k: v for k, v in metrics.items()
+                            if k not in _HOT_PROCESS_METRICS and k != 'num_handles'}
+            rows.append((
+                timestamp,
+                p.pid,
+                p.name,
+                p.command_line,
+                p.user,
+                p.cpu_percent,
+                p.memory_mb,
+                metrics.get('num_threads'),
+                metrics.get('num_fds', metrics.get('num_handles')),
+                metrics.get('io_read_bytes'),
+                metrics.get('io_write_bytes'),
+                _dumps_metrics(tail_metrics)
+            ))
+        
+        # 连接作为上下文管理器：成功时提交，出错时回滚整批，
+        # 避免失败批次中已写入的行被下一次采样的提交一并保存
+        with self._lock, self._conn:
+            # 同一次采样的时间戳由调用方统一生成，(timestamp, pid) 不会重复，
+            # 使用普通 INSERT 省去 OR REPLACE 的冲突处理；UNIQUE 约束仍作为兜底保留
+            self._conn.executemany('''
+                INSERT INTO processes 
+                (timestamp, pid, name, command_line, user, cpu_percent, memory_mb,
+                 num_threads, num_fds, io_read_bytes, io_write_bytes, extra_metrics)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
     
     def insert_system_info(self, system_info: SystemInfo) -> None:
         """插入系统信息"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        timestamp = system_info.timestamp.isoformat()
-        extra_metrics_json = json.dumps(system_info.extra_metrics) if system_info.extra_metrics else '{}'
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO system_info 
-            (timestamp, cpu_percent, memory_total_mb, memory_used_mb, memory_percent, extra_metrics)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            timestamp,
-            system_info.cpu_percent,
-            system_info.memory_total_mb,
-            system_info.memory_used_mb,
-            system_info.memory_percent,
-            extra_metrics_json
-        ))
-        
-        conn.commit()
-        conn.close()
+        timestamp = _datetime_to_ns(system_info.timestamp)
+        extra_metrics_json = _dumps_metrics(system_info.extra_metrics)
+        
+        with self._lock, self._conn:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO system_info 
+                (timestamp, cpu_percent, memory_total_mb, memory_used_mb, memory_percent, extra_metrics)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (
+                timestamp,
+                system_info.cpu_percent,
+                system_info.memory_total_mb,
+                system_info.memory_used_mb,
+                system_info.memory_percent,
+                extra_metrics_json
+            ))
     
     def get_process_data(self, pid: Optional[int] = None, name: Optional[str] = None, 
-                        start_time: Optional[str] = None, end_time: Optional[str] = None) -> List[Dict[str, Any]]:
+                        start_time: Optional[TimeValue] = None, end_time: Optional[TimeValue] = None,
+                        include_extra: bool = False) -> List[Dict[str, Any]]:
         """
         查询进程数据
         
         Args:
             pid: 进程ID（可选）
             name: 进程名（可选）
-            start_time: 开始时间（ISO格式，可选）
-            end_time: 结束时间（ISO格式，可选）
+            start_time: 开始时间（纳秒时间戳、datetime 或 ISO 格式，可选）
+            end_time: 结束时间（纳秒时间戳、datetime 或 ISO 格式，可选）
+            include_extra: 是否读取并解析 extra_metrics JSON（高频指标已单独成列）
         
         Returns:
-            进程数据列表
+            进程数据列表，timestamp 为纳秒时间戳
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        columns = (f'id, {self._ts_column()}, pid, name, command_line, user, cpu_percent, memory_mb, '
+                   f'{self._hot_metric_columns}')
+        if include_extra:
+            columns += ', extra_metrics'
+        query, params = self._build_process_query(columns, pid, name, start_time, end_time)
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        
+        # 直接按列位置构建字典，比 sqlite3.Row -> dict 转换快
+        result = [{
+            'id': r[0],
+            'timestamp': r[1],
+            'pid': r[2],
+            'name': r[3],
+            'command_line': r[4],
+            'user': r[5],
+            'cpu_percent': r[6],
+            'memory_mb': r[7],
+            'num_threads': r[8],
+            'num_fds': r[9],
+            'io_read_bytes': r[10],
+            'io_write_bytes': r[11],
+        } for r in rows]
+        
+        if include_extra:
+            loads = _loads_metrics
+            for data, r in zip(result, rows):
+                data['extra_metrics'] = loads(r[12])
+        return result
+    
+    def get_process_columns(self, pid: Optional[int] = None, name: Optional[str] = None,
+                            start_time: Optional[TimeValue] = None, end_time: Optional[TimeValue] = None) -> Dict[str, np.ndarray]:
+        """
+        按列查询进程数据，直接返回 NumPy 数组（供分析工具绘图使用）
+        
+        Args:
+            pid: 进程ID（可选）
+            name: 进程名（可选）
+            start_time: 开始时间（纳秒时间戳、datetime 或 ISO 格式，可选）
+            end_time: 结束时间（纳秒时间戳、datetime 或 ISO 格式，可选）
         
-        query = 'SELECT * FROM processes WHERE 1=1'
+        Returns:
+            {列名: 数组}，timestamp 为 int64 纳秒时间戳，其余指标为 float32（缺失值为 NaN）
+        """
+        metric_columns = ('cpu_percent', 'memory_mb') + _HOT_PROCESS_METRICS
+        query, params = self._build_process_query(
+            f'{self._ts_column()}, cpu_percent, memory_mb, {self._hot_metric_columns}',
+            pid, name, start_time, end_time
+        )
+        
+        # 结构化 dtype：游标逐行写入记录数组，不经过 fetchall 的元组列表（NULL 转为 NaN）。
+        # 指标用 float32 即可满足绘图和统计精度，内存和带宽减半；线程数等整数列
+        # 也用 float32，因为旧数据迁移后可能为 NULL，需要用 NaN 表示
+        dtype = [('timestamp', np.int64)] + [(column_name, np.float32) for column_name in metric_columns]
+        with self._lock:
+            records = np.fromiter(self._conn.execute(query, params), dtype=dtype)
+        
+        # 拆成各列的连续数组，便于后续切片和归约
+        return {column_name: np.ascontiguousarray(records[column_name]) for column_name in records.dtype.names}
+    
+    def _build_process_query(self, columns: str, pid: Optional[int], name: Optional[str],
+                             start_time: Optional[TimeValue], end_time: Optional[TimeValue]) -> tuple:
+        """构建进程数据查询语句，返回 (query, params)"""
+        query = f'SELECT {columns} FROM processes WHERE 1=1'
         params = []
         
         if pid is not None:
@@ -145,110 +376,116 @@ class DatabaseManager:
         
         if start_time:
             query += ' AND timestamp >= ?'
-            params.append(start_time)
+            params.append(self._ts_param(start_time))
         
         if end_time:
             query += ' AND timestamp <= ?'
-            params.append(end_time)
+            params.append(self._ts_param(end_time))
         
         query += ' ORDER BY timestamp'
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
-        result = []
-        for row in rows:
-            data = dict(row)
-            # 解析 extra_metrics JSON
-            if data['extra_metrics']:
-                try:
-                    data['extra_metrics'] = json.loads(data['extra_metrics'])
-                except:
-                    data['extra_metrics'] = {}
-            result.append(data)
-        
-        conn.close()
-        return result
+        return query, params
     
-    def get_system_data(self, start_time: Optional[str] = None, end_time: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_system_data(self, start_time: Optional[TimeValue] = None,
+                        end_time: Optional[TimeValue] = None) -> List[Dict[str, Any]]:
         """
         查询系统数据
         
         Args:
-            start_time: 开始时间（ISO格式，可选）
-            end_time: 结束时间（ISO格式，可选）
+            start_time: 开始时间（纳秒时间戳、datetime 或 ISO 格式，可选）
+            end_time: 结束时间（纳秒时间戳、datetime 或 ISO 格式，可选）
         
         Returns:
-            系统数据列表
+            系统数据列表，timestamp 为纳秒时间戳
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        query, params = self._build_system_query(
+            f'id, {self._ts_column()}, cpu_percent, memory_total_mb, memory_used_mb, memory_percent, extra_metrics',
+            start_time, end_time
+        )
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        
+        loads = _loads_metrics
+        return [{
+            'id': r[0],
+            'timestamp': r[1],
+            'cpu_percent': r[2],
+            'memory_total_mb': r[3],
+            'memory_used_mb': r[4],
+            'memory_percent': r[5],
+            'extra_metrics': loads(r[6]),
+        } for r in rows]
+    
+    def get_system_columns(self, start_time: Optional[TimeValue] = None,
+                           end_time: Optional[TimeValue] = None) -> Dict[str, np.ndarray]:
+        """
+        按列查询系统数据，直接返回 NumPy 数组（供分析工具绘图使用）
+        
+        Args:
+            start_time: 开始时间（纳秒时间戳、datetime 或 ISO 格式，可选）
+            end_time: 结束时间（纳秒时间戳、datetime 或 ISO 格式，可选）
         
-        query = 'SELECT * FROM system_info WHERE 1=1'
+        Returns:
+            {列名: 数组}，timestamp 为 int64 纳秒时间戳；disk_used 为磁盘已用量（GB），
+            由 SQLite 从 extra_metrics 中提取，无该指标时为 NaN
+        """
+        # json_valid 防止个别损坏的 JSON 让 json_extract 报错导致整个查询失败
+        disk_used = "CASE WHEN json_valid(extra_metrics) THEN json_extract(extra_metrics, '$.disk_usage.used') END"
+        query, params = self._build_system_query(
+            f'{self._ts_column()}, cpu_percent, memory_percent, {disk_used}', start_time, end_time
+        )
+        dtype = [('timestamp', np.int64), ('cpu_percent', np.float32),
+                 ('memory_percent', np.float32), ('disk_used', np.float32)]
+        with self._lock:
+            records = np.fromiter(self._conn.execute(query, params), dtype=dtype)
+        
+        return {column_name: np.ascontiguousarray(records[column_name]) for column_name in records.dtype.names}
+    
+    def _build_system_query(self, columns: str, start_time: Optional[TimeValue],
+                            end_time: Optional[TimeValue]) -> tuple:
+        """构建系统数据查询语句，返回 (query, params)"""
+        query = f'SELECT {columns} FROM system_info WHERE 1=1'
         params = []
         
         if start_time:
             query += ' AND timestamp >= ?'
-            params.append(start_time)
+            params.append(self._ts_param(start_time))
         
         if end_time:
             query += ' AND timestamp <= ?'
-            params.append(end_time)
+            params.append(self._ts_param(end_time))
         
         query += ' ORDER BY timestamp'
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
-        result = []
-        for row in rows:
-            data = dict(row)
-            # 解析 extra_metrics JSON
-            if data['extra_metrics']:
-                try:
-                    data['extra_metrics'] = json.loads(data['extra_metrics'])
-                except:
-                    data['extra_metrics'] = {}
-            result.append(data)
-        
-        conn.close()
-        return result
+        return query, params
     
     def get_all_process_names(self) -> List[str]:
         """获取所有唯一的进程名"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT DISTINCT name FROM processes ORDER BY name')
-        names = [row[0] for row in cursor.fetchall()]
-        
-        conn.close()
-        return names
+        with self._lock:
+            cursor = self._conn.execute('SELECT DISTINCT name FROM processes ORDER BY name')
+            return [row[0] for row in cursor.fetchall()]
     
     def get_all_pids(self, name: Optional[str] = None) -> List[int]:
         """获取所有唯一的PID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if name:
-            cursor.execute('SELECT DISTINCT pid FROM processes WHERE name = ? ORDER BY pid', (name,))
-        else:
-            cursor.execute('SELECT DISTINCT pid FROM processes ORDER BY pid')
-        
-        pids = [row[0] for row in cursor.fetchall()]
-        
-        conn.close()
-        return pids
+        with self._lock:
+            if name:
+                cursor = self._conn.execute('SELECT DISTINCT pid FROM processes WHERE name = ? ORDER BY pid', (name,))
+            else:
+                cursor = self._conn.execute('SELECT DISTINCT pid FROM processes ORDER BY pid')
+            return [row[0] for row in cursor.fetchall()]
+    
+    def get_all_name_pid_pairs(self) -> List[tuple]:
+        """获取所有唯一的 (进程名, PID) 组合，按进程名、PID 排序"""
+        with self._lock:
+            cursor = self._conn.execute('SELECT DISTINCT name, pid FROM processes ORDER BY name, pid')
+            return cursor.fetchall()
     
     def get_time_range(self) -> tuple:
-        """获取数据的时间范围"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT MIN(timestamp), MAX(timestamp) FROM processes')
-        result = cursor.fetchone()
-        
-        conn.close()
+        """获取数据的时间范围（纳秒时间戳）"""
+        min_ts = self._ts_column('(SELECT MIN(timestamp) FROM processes)')
+        max_ts = self._ts_column('(SELECT MAX(timestamp) FROM processes)')
+        with self._lock:
+            # 分别求 MIN/MAX 才能走索引两端直接取值，合在一起会扫描全表
+            cursor = self._conn.execute(f'SELECT {min_ts}, {max_ts}')
+            result = cursor.fetchone()
         return result if result else (None, None)
 
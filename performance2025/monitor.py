@@ -1,9 +1,7 @@
 """监测工具主程序"""
 import sys
 import argparse
-from PyQt6.QtWidgets import QApplication
 from config import ConfigManager
-from ui.monitor_window import MonitorWindow
 
 
 def main():
@@ -36,7 +34,10 @@ def main():
             print("命令行模式暂未实现，请使用 --ui 启动UI界面")
             return
         
-        # UI模式
+        # UI模式（PyQt6 较重，确认进入UI模式后再导入，--help 等不受影响）
+        from PyQt6.QtWidgets import QApplication
+        from ui.monitor_window import MonitorWindow
+        
         app = QApplication(sys.argv)
         window = MonitorWindow(config_manager)
         window.show()
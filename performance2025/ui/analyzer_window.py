@@ -1,11 +1,12 @@
 """统计分析工具窗口"""
 import sys
+from collections import OrderedDict
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, 
     QTreeWidgetItem, QPushButton, QFileDialog, QMessageBox, QSplitter,
-    QGridLayout, QLabel, QScrollArea, QDialog
+    QLabel, QScrollArea, QDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
 import matplotlib
 matplotlib.use('QtAgg')
@@ -13,7 +14,7 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 from database import DatabaseManager
@@ -23,30 +24,83 @@ plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode M
 plt.rcParams['axes.unicode_minus'] = False  # 解决负号显示问题
 
 
-class ChartWidget(QWidget):
-    """图表部件"""
-    def __init__(self, title: str, parent=None):
-        super().__init__(parent)
+def _relative_seconds(timestamps: np.ndarray) -> np.ndarray:
+    """将纳秒时间戳列表转换为相对首个采样点的秒数数组"""
+    ts = np.array(timestamps, dtype='datetime64[ns]')
+    return (ts - ts[0]) / np.timedelta64(1, 's')
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 降采样，返回选中点的下标
+    
+    首尾点固定保留，中间的点均分为 max_points - 2 个桶，每个桶选出与
+    上一个选中点、下一个桶均值构成三角形面积最大的点，保留尖峰形状。
+    """
+    count = x.size
+    edges = np.linspace(1, count - 1, max_points - 1).astype(np.int64)
+    sizes = np.diff(edges)
+    # 各桶均值一次算出；第 i 个桶使用第 i+1 个桶的均值，最后一个桶使用末点
+    next_x = np.append(np.add.reduceat(x[:count - 1], edges[:-1])[1:] / sizes[1:], x[-1])
+    next_y = np.append(np.add.reduceat(y[:count - 1], edges[:-1])[1:] / sizes[1:], y[-1])
+    
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = count - 1
+    selected = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[selected], y[selected]
+        # 三角形面积（省略 1/2）：以上一个选中点为顶点的叉积
+        areas = np.abs((ax - next_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[i] - ay))
+        selected = lo + int(areas.argmax())
+        indices[i + 1] = selected
+    return indices
+
+
+def _downsample(x: np.ndarray, y: np.ndarray, max_points: int = 1000) -> tuple:
+    """数据量过大时用 LTTB 降采样，返回 (x, y)"""
+    if x.size <= max_points:
+        return x, y
+    indices = _lttb_indices(x, y, max_points)
+    return x[indices], y[indices]
+
+
+def _summary(values: np.ndarray) -> tuple:
+    """对已有数组做归约，返回 (平均值, 最大值, 最小值)"""
+    return values.mean(), values.max(), values.min()
+
+
+class ChartWidget:
+    """图表：共享画布上的一个子图"""
+    def __init__(self, title: str, ax, canvas: FigureCanvas):
         self.title = title
-        self.figure = Figure(figsize=(4, 3))
-        self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111)
-        
-        layout = QVBoxLayout()
-        layout.addWidget(QLabel(title))
-        layout.addWidget(self.canvas)
-        self.setLayout(layout)
+        self.ax = ax
+        self.canvas = canvas
+        # 曲线对象常驻，更新数据时只替换坐标，不再清空重建坐标轴；
+        # animated 的曲线不参与整图绘制，由 blit 单独绘制
+        self._line, = self.ax.plot([], [], animated=True, antialiased=False)
+        self.ax.set_title(self.title)
+        self.ax.grid(True, antialiased=False)
+        # 坐标轴静态背景（不含曲线），每次整图绘制（含窗口缩放）后重新截取
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        # 当前绘制的数据（放大对话框直接使用）
+        self.x_data: Optional[np.ndarray] = None
+        self.y_data: Optional[np.ndarray] = None
     
-    def plot(self, x_data: List[float], y_data: List[float], label: str = ""):
+    def plot(self, x_data: np.ndarray, y_data: np.ndarray, label: str = ""):
         """绘制图表"""
-        self.ax.clear()
-        self.ax.plot(x_data, y_data, label=label)
-        self.ax.set_title(self.title)
-        self.ax.grid(True)
+        old_limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        self.x_data, self.y_data = x_data, y_data
+        self._line.set_data(x_data, y_data)
+        self._line.set_label(label)
+        self.ax.relim()
+        self.ax.autoscale_view(scaley=False)
         # 设置纵轴起点为0
         if len(y_data) > 0:
-            y_min = min(y_data)
-            y_max = max(y_data)
+            y_min = np.min(y_data)
+            y_max = np.max(y_data)
             if y_min == y_max:
                 # 如果所有值相同，设置一个小的范围
                 self.ax.set_ylim(0, max(y_max * 1.1, 1))
@@ -57,49 +111,102 @@ class ChartWidget(QWidget):
             self.ax.set_ylim(bottom=0)
         if label:
             self.ax.legend()
-        self.canvas.draw()
+        
+        if self._background is not None and not label \
+                and old_limits == (self.ax.get_xlim(), self.ax.get_ylim()):
+            # 坐标范围未变：恢复背景后只重绘曲线
+            self.canvas.restore_region(self._background)
+            self.ax.draw_artist(self._line)
+            self.canvas.blit(self.ax.bbox)
+        else:
+            # 刻度等静态内容有变化，需要整图重绘；draw_idle 合并重绘请求
+            self.canvas.draw_idle()
+    
+    def _on_draw(self, event):
+        """整图绘制完成后截取背景，并补画曲线"""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._line)
 
 
 class ChartDialog(QDialog):
-    """图表放大对话框"""
-    def __init__(self, title: str, x_data: List[float], y_data: List[float], parent=None):
+    """图表放大对话框（pyqtgraph 绘制，支持流畅的平移缩放）"""
+    def __init__(self, title: str, x_data: np.ndarray, y_data: np.ndarray, parent=None):
         super().__init__(parent)
+        # 延迟导入：ui 包会同时导入监测窗口，只有打开放大图时才需要 pyqtgraph
+        import pyqtgraph as pg
+        
         self.setWindowTitle(title)
         self.setGeometry(100, 100, 800, 600)
         
         layout = QVBoxLayout()
         
-        self.figure = Figure(figsize=(10, 6))
-        self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111)
-        
-        self.ax.plot(x_data, y_data)
-        self.ax.set_title(title)
-        self.ax.grid(True)
+        self.plot_widget = pg.PlotWidget(title=title, background='w')
+        self.plot_widget.showGrid(x=True, y=True)
+        # 只绘制可见范围内的点，缩小时按峰值降采样
+        self.plot_widget.setClipToView(True)
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        self.plot_widget.plot(x_data, y_data, pen=pg.mkPen('#1f77b4'))
         # 设置纵轴起点为0
         if len(y_data) > 0:
-            y_min = min(y_data)
-            y_max = max(y_data)
+            y_min = np.min(y_data)
+            y_max = np.max(y_data)
             if y_min == y_max:
                 # 如果所有值相同，设置一个小的范围
-                self.ax.set_ylim(0, max(y_max * 1.1, 1))
+                self.plot_widget.setYRange(0, max(y_max * 1.1, 1), padding=0)
             else:
                 # 设置底部为0，顶部留一些空间
-                self.ax.set_ylim(bottom=0, top=y_max * 1.05)
-        else:
-            self.ax.set_ylim(bottom=0)
+                self.plot_widget.setYRange(0, y_max * 1.05, padding=0)
         
-        layout.addWidget(self.canvas)
+        layout.addWidget(self.plot_widget)
         self.setLayout(layout)
 
 
+class LoadProcessSignals(QObject):
+    """进程数据加载任务的信号（QRunnable 本身不能发信号）"""
+    finished = pyqtSignal(object)  # (db_path, name, pid, columns, system_columns)
+    failed = pyqtSignal(str)
+
+
+class LoadProcessTask(QRunnable):
+    """在线程池中查询进程数据，避免大数据库阻塞界面"""
+    def __init__(self, db_manager: DatabaseManager, db_path: str, name: str, pid: int):
+        super().__init__()
+        self.db_manager = db_manager
+        self.db_path = db_path
+        self.name = name
+        self.pid = pid
+        self.signals = LoadProcessSignals()
+    
+    def run(self):
+        try:
+            # 进程指标按列读取为数组，绘图和统计直接使用，不再逐行构造字典
+            columns = self.db_manager.get_process_columns(pid=self.pid)
+            system_data = self.db_manager.get_system_columns()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit((self.db_path, self.name, self.pid, columns, system_data))
+
+
 class AnalyzerWindow(QMainWindow):
     """统计分析工具主窗口"""
     
+    # 字节转 MB 的倍数（乘法代替两次除法）
+    _MB_INV = 1.0 / (1024 * 1024)
+    
+    # 进程数据缓存的最大条目数
+    _DATA_CACHE_SIZE = 16
+    
     def __init__(self):
         super().__init__()
         self.db_managers: Dict[str, DatabaseManager] = {}  # {db_path: DatabaseManager}
         self.current_process_data: Optional[Dict] = None
+        # 已加载的进程数据 {(db_path, pid): (columns, system_columns)}，按最近使用顺序淘汰
+        self._data_cache: OrderedDict = OrderedDict()
+        # 最近一次请求加载的 (db_path, pid)，后台返回的旧结果只缓存不显示
+        self._loading_key: Optional[tuple] = None
+        # 正在后台加载的任务信号
+        self._load_signals = set()
         
         self.init_ui()
     
@@ -146,30 +253,25 @@ class AnalyzerWindow(QMainWindow):
         # 滚动区域
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_widget = QWidget()
-        self.chart_layout = QGridLayout(scroll_widget)
-        self.chart_layout.setSpacing(10)
         
-        # 创建9个图表占位符
-        self.charts = []
+        # 9个图表共用一个画布（3x3 子图），刷新时只有一次绘制和一次重绘事件
+        self.figure = Figure(figsize=(12, 9), dpi=72)
+        self.figure.subplots_adjust(hspace=0.4, wspace=0.3)
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setMinimumSize(900, 675)
+        
         chart_titles = [
             "CPU使用率 (%)", "内存使用 (MB)", "线程数",
             "句柄数/文件描述符", "IO读取 (Bytes)", "IO写入 (Bytes)",
             "系统CPU (%)", "系统内存 (%)", "其他指标"
         ]
+        axes = self.figure.subplots(3, 3).flat
+        self.charts = [ChartWidget(title, ax, self.canvas) for title, ax in zip(chart_titles, axes)]
         
-        for i, title in enumerate(chart_titles):
-            chart = ChartWidget(title)
-            self.charts.append(chart)
-            row = i // 3
-            col = i % 3
-            self.chart_layout.addWidget(chart, row, col)
-            
-            # 双击事件
-            chart.canvas.mpl_connect('button_press_event', 
-                lambda e, idx=i: self.on_chart_double_click(e, idx) if e.dblclick else None)
+        # 双击事件：按点击所在的子图确定图表
+        self.canvas.mpl_connect('button_press_event', self._on_canvas_press)
         
-        scroll_area.setWidget(scroll_widget)
+        scroll_area.setWidget(self.canvas)
         right_layout.addWidget(scroll_area)
         
         splitter.addWidget(left_widget)
@@ -185,53 +287,96 @@ class AnalyzerWindow(QMainWindow):
             self, "选择数据库文件", "", "SQLite数据库 (*.db);;所有文件 (*)"
         )
         
-        for file_path in file_paths:
-            if file_path not in self.db_managers:
-                try:
-                    db_manager = DatabaseManager(file_path)
-                    self.db_managers[file_path] = db_manager
-                    
-                    # 添加到树
-                    db_item = QTreeWidgetItem(self.tree)
-                    db_item.setText(0, Path(file_path).name)
-                    db_item.setData(0, Qt.ItemDataRole.UserRole, file_path)
-                    db_item.setExpanded(True)
-                    
-                    # 添加进程
-                    process_names = db_manager.get_all_process_names()
-                    for name in sorted(process_names):
-                        pids = db_manager.get_all_pids(name)
-                        for pid in sorted(pids):
-                            process_item = QTreeWidgetItem(db_item)
-                            process_item.setText(0, f"{name} (PID: {pid})")
+        # 批量添加树节点期间暂停重绘和信号，结束后统一刷新一次
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            for file_path in file_paths:
+                if file_path not in self.db_managers:
+                    try:
+                        db_manager = DatabaseManager(file_path, read_only=True)
+                        self.db_managers[file_path] = db_manager
+                        
+                        # 添加到树
+                        db_item = QTreeWidgetItem([Path(file_path).name])
+                        db_item.setData(0, Qt.ItemDataRole.UserRole, file_path)
+                        
+                        # 先构造全部进程节点，再一次性挂到数据库节点下
+                        process_items = []
+                        for name, pid in db_manager.get_all_name_pid_pairs():
+                            process_item = QTreeWidgetItem([f"{name} (PID: {pid})"])
                             process_item.setData(0, Qt.ItemDataRole.UserRole, {
                                 'db_path': file_path,
                                 'name': name,
                                 'pid': pid
                             })
-                    
-                except Exception as e:
-                    QMessageBox.warning(self, "错误", f"加载数据库失败: {e}")
+                            process_items.append(process_item)
+                        db_item.addChildren(process_items)
+                        
+                        self.tree.addTopLevelItem(db_item)
+                        db_item.setExpanded(True)
+                        
+                    except Exception as e:
+                        QMessageBox.warning(self, "错误", f"加载数据库失败: {e}")
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.viewport().update()
     
     def on_tree_item_clicked(self, item: QTreeWidgetItem, column: int):
         """树项点击事件"""
         data = item.data(0, Qt.ItemDataRole.UserRole)
         if isinstance(data, dict):
-            # 进程项
+            # 进程项；重复点击当前（或正在加载的）进程时不再重新加载和绘制
+            if (data['db_path'], data['pid']) == self._loading_key:
+                return
             self.load_process_data(data['db_path'], data['name'], data['pid'])
     
     def load_process_data(self, db_path: str, name: str, pid: int):
-        """加载进程数据"""
-        db_manager = self.db_managers[db_path]
-        process_data = db_manager.get_process_data(pid=pid)
-        system_data = db_manager.get_system_data()
+        """加载进程数据（命中缓存时直接显示，否则在线程池中查询数据库）"""
+        key = (db_path, pid)
+        self._loading_key = key
+        cached = self._data_cache.get(key)
+        if cached is not None:
+            self._data_cache.move_to_end(key)
+            self._show_process_data(name, pid, *cached)
+            return
         
-        if not process_data:
+        task = LoadProcessTask(self.db_managers[db_path], db_path, name, pid)
+        # 保留信号对象的引用，直到结果回到主线程
+        self._load_signals.add(task.signals)
+        task.signals.finished.connect(self._on_process_data_loaded)
+        task.signals.failed.connect(self._on_process_data_failed)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_process_data_loaded(self, result: tuple):
+        """后台查询完成（主线程）：写入缓存，仍是当前选中的进程时显示"""
+        self._load_signals.discard(self.sender())
+        db_path, name, pid, columns, system_data = result
+        key = (db_path, pid)
+        self._data_cache[key] = (columns, system_data)
+        if len(self._data_cache) > self._DATA_CACHE_SIZE:
+            self._data_cache.popitem(last=False)
+        
+        if key == self._loading_key:
+            self._show_process_data(name, pid, columns, system_data)
+    
+    def _on_process_data_failed(self, message: str):
+        """后台查询失败（主线程）"""
+        self._load_signals.discard(self.sender())
+        self._loading_key = None  # 允许再次点击重试
+        QMessageBox.warning(self, "错误", f"加载进程数据失败: {message}")
+    
+    def _show_process_data(self, name: str, pid: int, columns: Dict[str, np.ndarray],
+                           system_data: Dict[str, np.ndarray]):
+        """显示进程数据"""
+        if len(columns['timestamp']) == 0:
+            self._loading_key = None
             QMessageBox.information(self, "提示", "该进程没有数据")
             return
         
         self.current_process_data = {
-            'process': process_data,
+            'columns': columns,
             'system': system_data,
             'name': name,
             'pid': pid
@@ -240,124 +385,102 @@ class AnalyzerWindow(QMainWindow):
         self.update_charts()
         self.update_analysis()
     
-    def sample_data(self, data: List[Dict], max_points: int = 1000) -> List[Dict]:
-        """数据采样，避免数据量过大"""
-        if len(data) <= max_points:
-            return data
-        
-        step = len(data) / max_points
-        indices = [int(i * step) for i in range(max_points)]
-        return [data[i] for i in indices]
-    
     def update_charts(self):
         """更新图表"""
         if not self.current_process_data:
             return
         
-        process_data = self.sample_data(self.current_process_data['process'])
-        system_data = self.sample_data(self.current_process_data['system'])
+        columns = self.current_process_data['columns']
+        system_data = self.current_process_data['system']
         
-        # 准备时间轴（转换为相对时间，秒）
-        if process_data:
-            start_time = process_data[0]['timestamp']
-            from datetime import datetime
-            start_dt = datetime.fromisoformat(start_time)
-            
+        # 准备时间轴（纳秒时间戳转换为相对时间，秒）；各曲线分别降采样
+        if len(columns['timestamp']) > 0:
             # CPU使用率
-            timestamps = [(datetime.fromisoformat(d['timestamp']) - start_dt).total_seconds() 
-                         for d in process_data]
-            cpu_values = [d['cpu_percent'] for d in process_data]
-            self.charts[0].plot(timestamps, cpu_values)
+            timestamps = _relative_seconds(columns['timestamp'])
+            self.charts[0].plot(*_downsample(timestamps, columns['cpu_percent']))
             
             # 内存使用
-            memory_values = [d['memory_mb'] for d in process_data]
-            self.charts[1].plot(timestamps, memory_values)
+            self.charts[1].plot(*_downsample(timestamps, columns['memory_mb']))
             
-            # 线程数
-            thread_values = [d.get('extra_metrics', {}).get('num_threads', 0) for d in process_data]
-            self.charts[2].plot(timestamps, thread_values)
+            # 线程数（缺失值按 0 处理）
+            self.charts[2].plot(*_downsample(timestamps, np.nan_to_num(columns['num_threads'])))
             
             # 句柄数/文件描述符
-            handles_key = 'num_handles' if 'num_handles' in process_data[0].get('extra_metrics', {}) else 'num_fds'
-            handles_values = [d.get('extra_metrics', {}).get(handles_key, 0) for d in process_data]
-            self.charts[3].plot(timestamps, handles_values)
+            self.charts[3].plot(*_downsample(timestamps, np.nan_to_num(columns['num_fds'])))
             
             # IO读取
-            io_read_values = [d.get('extra_metrics', {}).get('io_read_bytes', 0) / 1024 / 1024 
-                            for d in process_data]  # 转换为MB
-            self.charts[4].plot(timestamps, io_read_values)
+            io_read_values = np.nan_to_num(columns['io_read_bytes'])  # 新数组，可原地换算
+            io_read_values *= self._MB_INV  # 转换为MB
+            self.charts[4].plot(*_downsample(timestamps, io_read_values))
             
             # IO写入
-            io_write_values = [d.get('extra_metrics', {}).get('io_write_bytes', 0) / 1024 / 1024 
-                             for d in process_data]  # 转换为MB
-            self.charts[5].plot(timestamps, io_write_values)
+            io_write_values = np.nan_to_num(columns['io_write_bytes'])
+            io_write_values *= self._MB_INV  # 转换为MB
+            self.charts[5].plot(*_downsample(timestamps, io_write_values))
         
         # 系统指标
-        if system_data:
-            start_time = system_data[0]['timestamp']
-            from datetime import datetime
-            start_dt = datetime.fromisoformat(start_time)
-            
-            sys_timestamps = [(datetime.fromisoformat(d['timestamp']) - start_dt).total_seconds() 
-                            for d in system_data]
-            sys_cpu_values = [d['cpu_percent'] for d in system_data]
-            self.charts[6].plot(sys_timestamps, sys_cpu_values)
+        if len(system_data['timestamp']) > 0:
+            sys_timestamps = _relative_seconds(system_data['timestamp'])
+            self.charts[6].plot(*_downsample(sys_timestamps, system_data['cpu_percent']))
             
-            sys_memory_values = [d['memory_percent'] for d in system_data]
-            self.charts[7].plot(sys_timestamps, sys_memory_values)
+            self.charts[7].plot(*_downsample(sys_timestamps, system_data['memory_percent']))
             
             # 其他指标（可以显示磁盘IO等）
-            if system_data[0].get('extra_metrics'):
-                disk_usage = [d.get('extra_metrics', {}).get('disk_usage', {}).get('used', 0) 
-                            for d in system_data]
-                self.charts[8].plot(sys_timestamps, disk_usage)
+            disk_used = system_data['disk_used']
+            if not np.isnan(disk_used).all():
+                self.charts[8].plot(*_downsample(sys_timestamps, np.nan_to_num(disk_used)))
     
     def update_analysis(self):
         """更新分析结果"""
         if not self.current_process_data:
             return
         
-        process_data = self.current_process_data['process']
+        columns = self.current_process_data['columns']
         name = self.current_process_data['name']
         pid = self.current_process_data['pid']
         
-        if not process_data:
+        if len(columns['timestamp']) == 0:
             return
         
-        # 计算统计信息
-        cpu_values = [d['cpu_percent'] for d in process_data]
-        memory_values = [d['memory_mb'] for d in process_data]
+        # 计算统计信息（直接在列数组上归约，不再重建数组）
+        cpu_mean, cpu_max, cpu_min = _summary(columns['cpu_percent'])
+        mem_mean, mem_max, mem_min = _summary(columns['memory_mb'])
         
         analysis_text = f"""
 进程: {name} (PID: {pid})
-数据点数: {len(process_data)}
+数据点数: {len(columns['timestamp'])}
 
 CPU使用率:
-  平均值: {np.mean(cpu_values):.2f}%
-  最大值: {np.max(cpu_values):.2f}%
-  最小值: {np.min(cpu_values):.2f}%
+  平均值: {cpu_mean:.2f}%
+  最大值: {cpu_max:.2f}%
+  最小值: {cpu_min:.2f}%
 
 内存使用:
-  平均值: {np.mean(memory_values):.2f} MB
-  最大值: {np.max(memory_values):.2f} MB
-  最小值: {np.min(memory_values):.2f} MB
+  平均值: {mem_mean:.2f} MB
+  最大值: {mem_max:.2f} MB
+  最小值: {mem_min:.2f} MB
         """
         
         self.analysis_label.setText(analysis_text.strip())
     
+    def _on_canvas_press(self, event):
+        """画布鼠标事件，双击时打开所在子图的放大对话框"""
+        if not event.dblclick or event.inaxes is None:
+            return
+        for index, chart in enumerate(self.charts):
+            if chart.ax is event.inaxes:
+                self.on_chart_double_click(event, index)
+                return
+    
     def on_chart_double_click(self, event, chart_index: int):
         """图表双击事件"""
         if not self.current_process_data or chart_index >= len(self.charts):
             return
         
         chart = self.charts[chart_index]
-        # 获取图表数据
-        if len(chart.ax.lines) > 0:
-            line = chart.ax.lines[0]
-            x_data = line.get_xdata()
-            y_data = line.get_ydata()
-            
-            dialog = ChartDialog(chart.title, x_data, y_data, self)
+        # 直接使用绘图时保存的数组，不经 Line2D 取回副本
+        if chart.x_data is not None:
+            dialog = ChartDialog(chart.title, chart.x_data, chart.y_data, self)
             dialog.exec()
     
     def keyPressEvent(self, event):
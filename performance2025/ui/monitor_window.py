@@ -2,38 +2,311 @@
 import sys
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-    QTableWidgetItem, QPushButton, QLineEdit, QLabel,
-    QFileDialog, QSpinBox, QMessageBox, QSplitter, QSizePolicy
+    QTableWidgetItem, QPushButton, QLineEdit, QLabel, QListView,
+    QAbstractItemView, QFileDialog, QSpinBox, QMessageBox, QSplitter, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
-from typing import Dict, Set, Optional
+from PyQt6.QtCore import (
+    Qt, QEvent, QTimer, QSignalBlocker, QAbstractListModel, QModelIndex, QObject, QThread,
+    pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QFont, QPainter
+from typing import Callable, List, Set, Optional, Tuple
+from datetime import datetime
 import threading
 import time
 
 from config import ConfigManager
 
 
+class RunningProcessModel(QAbstractListModel):
+    """运行中的进程名列表模型（按进程名排序，不区分大小写）"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        # 与 _names 一一对应的小写进程名（排序和比较用），只在进程出现时计算一次
+        self._keys: List[str] = []
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._names[index.row()]
+        return None
+    
+    def name(self, row: int) -> str:
+        """获取指定行的进程名"""
+        return self._names[row]
+    
+    def key(self, row: int) -> str:
+        """获取指定行的小写进程名"""
+        return self._keys[row]
+    
+    def set_entries(self, entries: List[Tuple[str, str]]):
+        """
+        更新进程名列表，只对变化的行发出插入/删除/数据变化通知
+        
+        Args:
+            entries: 已按小写进程名排序的 (小写进程名, 进程名) 列表
+        """
+        # 两个有序序列一次归并：连续的新增/退出进程各合并为一次插入/删除通知
+        keys = self._keys
+        names = self._names
+        i = j = 0
+        n = len(entries)
+        while j < n or i < len(keys):
+            if i < len(keys) and (j >= n or keys[i] < entries[j][0]):
+                # 已退出的进程：找到连续区间一次删除
+                end = i + 1
+                while end < len(keys) and (j >= n or keys[end] < entries[j][0]):
+                    end += 1
+                self.beginRemoveRows(QModelIndex(), i, end - 1)
+                del keys[i:end]
+                del names[i:end]
+                self.endRemoveRows()
+            elif i >= len(keys) or entries[j][0] < keys[i]:
+                # 新出现的进程：找到连续区间一次插入
+                end = j + 1
+                while end < n and (i >= len(keys) or entries[end][0] < keys[i]):
+                    end += 1
+                added = entries[j:end]
+                self.beginInsertRows(QModelIndex(), i, i + len(added) - 1)
+                keys[i:i] = [key for key, _ in added]
+                names[i:i] = [name for _, name in added]
+                self.endInsertRows()
+                i += len(added)
+                j = end
+            elif names[i] != entries[j][1]:
+                # 同一小写进程名的显示写法变了（如 "Foo" 退出而 "foo" 仍在运行）：
+                # 找到连续区间更新名称，一次通知重绘
+                start = i
+                while (i < len(keys) and j < n and keys[i] == entries[j][0]
+                       and names[i] != entries[j][1]):
+                    names[i] = entries[j][1]
+                    i += 1
+                    j += 1
+                self.dataChanged.emit(self.index(start), self.index(i - 1),
+                                      [Qt.ItemDataRole.DisplayRole])
+            else:
+                i += 1
+                j += 1
+
+
+class ElapsedLabel(QLabel):
+    """最新记录时间标签（绘制时计算已过秒数，不通过 setText 触发布局）"""
+    
+    WAITING_TEXT = "最新记录时间: 等待中..."
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ref: Optional[datetime] = None
+        self._active = False
+        # 只负责每秒重绘一次，刷新"秒前"的显示
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.timeout.connect(self.update)
+        # 固定最小宽度，文本变化时不需要重新布局
+        self.setMinimumWidth(self.fontMetrics().horizontalAdvance(
+            "最新记录时间: 0000-00-00 00:00:00 (00000秒前)"))
+    
+    def start(self):
+        """开始显示（等待第一条记录）"""
+        self._ref = None
+        self._active = True
+        self._repaint_timer.start(1000)
+        self.update()
+    
+    def stop(self):
+        """停止显示并清空"""
+        self._active = False
+        self._ref = None
+        self._repaint_timer.stop()
+        self.update()
+    
+    @pyqtSlot(object)
+    def set_reference(self, ts: datetime):
+        """设置最新记录时间（只标记重绘）"""
+        if self._active:
+            self._ref = ts
+            self.update()
+    
+    def display_text(self) -> str:
+        """当前应显示的文本"""
+        if not self._active:
+            return ""
+        if self._ref is None:
+            return self.WAITING_TEXT
+        elapsed = (datetime.now() - self._ref).total_seconds()
+        return f"最新记录时间: {self._ref:%Y-%m-%d %H:%M:%S} ({elapsed:.0f}秒前)"
+    
+    def paintEvent(self, event):
+        text = self.display_text()
+        if not text:
+            return
+        painter = QPainter(self)
+        painter.drawText(self.contentsRect(), int(self.alignment()), text)
+        painter.end()
+
+
+class ProcessScanner(QObject):
+    """运行进程扫描器（移动到后台线程执行，枚举 /proc 不阻塞界面）"""
+    
+    # 扫描结果：去重并按小写进程名排序的 [(小写进程名, 进程名)]
+    scanned = pyqtSignal(list)
+    # 扫描失败（参数为错误信息）
+    failed = pyqtSignal(str)
+    
+    def __init__(self, collector):
+        super().__init__()
+        self.collector = collector
+    
+    @pyqtSlot()
+    def do_scan(self):
+        """扫描运行中的进程（按进程名去重）"""
+        try:
+            # 采集器直接返回去重并排序后的进程名，不构造每个进程的 ProcessInfo
+            self.scanned.emit(self.collector.get_unique_process_names_fast())
+        except Exception as e:
+            import traceback
+            print(f"刷新进程列表时出错: {e}")
+            traceback.print_exc()
+            self.failed.emit(str(e))
+
+
+class MonitorWorker(QObject):
+    """监测工作对象（移动到 QThread 中执行采样循环，通过信号通知界面）"""
+    
+    # 写入一次记录后发出（参数为记录时间）
+    record_written = pyqtSignal(object)
+    # 采样出错时发出（参数为错误信息）
+    error = pyqtSignal(str)
+    # 采样循环结束
+    finished = pyqtSignal()
+    
+    def __init__(self, collector, db_manager, interval: int,
+                 get_monitored_names: Callable[[], frozenset], stop_event: threading.Event):
+        super().__init__()
+        self.collector = collector
+        self.db_manager = db_manager
+        self.interval = interval
+        # 返回监控进程名（小写）快照，每次采样重新获取，监测中增删的进程在下一次采样生效
+        self.get_monitored_names = get_monitored_names
+        # 停止监测时置位，立即唤醒正在等待下一次采样的循环
+        self.stop_event = stop_event
+    
+    @pyqtSlot()
+    def run(self):
+        """
+        监测循环（按进程名监控，不区分大小写）
+        
+        循环结束后由本线程关闭数据库，停止监测时等待超时也不会在写入过程中关闭连接
+        """
+        try:
+            self._run()
+        finally:
+            self.db_manager.close()
+            self.finished.emit()
+    
+    def _run(self):
+        interval = self.interval
+        stop_event = self.stop_event
+        
+        # 初始化所有进程的CPU使用率（非阻塞模式需要先初始化）
+        import psutil
+        try:
+            # 初始化系统CPU
+            psutil.cpu_percent(interval=None)
+            
+            # 初始化所有监控进程的CPU（由采集器建立基准，后续采样按差值计算）
+            self.collector.prime_cpu(self.get_monitored_names())
+        except Exception as e:
+            print(f"初始化CPU使用率时出错: {e}")
+        
+        # 按固定节拍采样：下一次采样时间按间隔累加，不受每次采样耗时影响；
+        # 等待使用 Event.wait，停止监测时立即返回
+        next_tick = time.monotonic() + interval
+        
+        # 循环内使用的方法先绑定到局部变量，避免每次采样重复查找属性
+        get_monitored_names = self.get_monitored_names
+        get_processes_by_name = self.collector.get_processes_by_name
+        get_system_info = self.collector.get_system_info
+        insert_process_infos = self.db_manager.insert_process_infos
+        insert_system_info = self.db_manager.insert_system_info
+        emit_record_written = self.record_written.emit
+        emit_error = self.error.emit
+        monotonic = time.monotonic
+        time_ns = time.time_ns
+        now = datetime.now
+        wait = stop_event.wait
+        
+        # 等待一个间隔，让CPU数据有值
+        if wait(interval):
+            return
+        
+        while not stop_event.is_set():
+            try:
+                processes_to_record = []
+                
+                # 按进程名获取所有匹配的进程（不区分大小写）
+                for name_lower in get_monitored_names():
+                    # 获取所有同名进程（包括新启动的）
+                    processes_to_record.extend(get_processes_by_name(name_lower))
+                
+                # 记录进程数据（同一次采样批量写入，单个事务）
+                if processes_to_record:
+                    insert_process_infos(processes_to_record, time_ns())
+                
+                # 记录系统数据
+                insert_system_info(get_system_info())
+                
+                # 更新最新记录时间
+                emit_record_written(now())
+            except Exception as e:
+                emit_error(str(e))
+            
+            next_tick += interval
+            delay = next_tick - monotonic()
+            if delay < 0:
+                # 采样耗时超过间隔，从当前时间重新计时，不连续补采
+                next_tick = monotonic()
+                delay = 0
+            if wait(delay):
+                break
+
+
 class MonitorWindow(QMainWindow):
     """监测工具主窗口"""
     
+    # 请求后台扫描运行进程（跨线程信号，自动以队列方式投递）
+    scan_requested = pyqtSignal()
+    
+    # 运行进程列表的刷新间隔（毫秒），从上一次扫描开始计
+    REFRESH_INTERVAL_MS = 2000
+    # 两次扫描之间的最短间隔（毫秒），扫描耗时接近刷新间隔时也给界面留出处理时间
+    MIN_REFRESH_DELAY_MS = 100
+    
     def __init__(self, config_manager: ConfigManager):
         super().__init__()
         try:
             self.config_manager = config_manager
             self.db_manager = None
             self.monitoring = False
-            self.monitor_thread: threading.Thread = None
+            self.monitor_thread: Optional[QThread] = None
+            self.monitor_worker: Optional[MonitorWorker] = None
+            # 停止监测时置位，立即唤醒正在等待下一次采样的监测线程；
+            # 每次开始监测新建，未及时退出的旧线程不会因重新开始而继续运行
+            self._stop_event = threading.Event()
+            # 监控的进程名（小写）快照，由界面线程在列表变化时整体替换，
+            # 监测线程每次采样直接读取引用，不访问表格控件
+            self._monitored_names_lock = threading.Lock()
+            self._monitored_names: frozenset = frozenset()
             self.monitored_pids: Set[int] = set()
             self.collector = None  # 延迟初始化
-            
-            # 用于增量更新的进程字典 {进程名小写: 进程名}
-            self.current_processes: Dict[str, str] = {}
-            
-            # 监测相关
-            self.last_record_time = None
-            self.update_time_timer = QTimer()
-            self.update_time_timer.timeout.connect(self.update_last_record_time)
+            self.scan_thread: Optional[QThread] = None
+            self.refresh_timer: Optional[QTimer] = None
+            # 后台扫描进行中（结果返回前不再发起新的扫描）
+            self._scan_in_flight = False
+            self._scan_started = 0.0
             
             self.init_ui()
             self.load_config()
@@ -51,6 +324,7 @@ class MonitorWindow(QMainWindow):
         try:
             from collector import create_collector
             self.collector = create_collector()
+            self._start_scanner()
             self.start_refresh_timer()
         except Exception as e:
             import traceback
@@ -88,6 +362,7 @@ class MonitorWindow(QMainWindow):
         self.monitored_table.horizontalHeader().setStretchLastSection(True)
         self.monitored_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.monitored_table.setMinimumWidth(350)
+        self.monitored_table.itemChanged.connect(self.on_monitored_item_changed)
         left_layout.addWidget(self.monitored_table, 1)  # 设置stretch factor为1
         
         # 添加进程按钮
@@ -111,16 +386,16 @@ class MonitorWindow(QMainWindow):
         right_layout.setSpacing(5)
         right_layout.addWidget(QLabel("当前系统运行的进程（按进程名排序）"))
         
-        self.running_table = QTableWidget()
-        self.running_table.setColumnCount(1)
-        self.running_table.setHorizontalHeaderLabels(["进程名"])
-        self.running_table.horizontalHeader().setStretchLastSection(True)
-        self.running_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.running_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)  # 支持多选
-        self.running_table.setSortingEnabled(True)  # 启用排序
+        # 模型原地增删行，刷新时无需逐行创建表格项，选中状态也随之保留
+        self.running_model = RunningProcessModel(self)
+        self.running_list = QListView()
+        self.running_list.setModel(self.running_model)
+        self.running_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.running_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)  # 支持多选
+        self.running_list.setUniformItemSizes(True)
         # 双击事件
-        self.running_table.itemDoubleClicked.connect(self.on_running_table_double_clicked)
-        right_layout.addWidget(self.running_table, 1)  # 设置stretch factor为1
+        self.running_list.doubleClicked.connect(self.on_running_list_double_clicked)
+        right_layout.addWidget(self.running_list, 1)  # 设置stretch factor为1
         
         add_to_monitor_btn = QPushButton("添加到监控列表")
         add_to_monitor_btn.clicked.connect(self.add_to_monitor)
@@ -171,7 +446,7 @@ class MonitorWindow(QMainWindow):
         self.status_label = QLabel("状态: 未开始")
         bottom_layout.addWidget(self.status_label)
         
-        self.last_record_label = QLabel("")
+        self.last_record_label = ElapsedLabel()
         bottom_layout.addWidget(self.last_record_label)
         
         main_layout.addWidget(bottom_widget, 0)  # stretch factor为0，不扩展
@@ -184,18 +459,50 @@ class MonitorWindow(QMainWindow):
         # 加载监控的进程列表（去重，不区分大小写）
         monitored_processes = self.config_manager.get_monitored_processes()
         # 去重，保留第一次出现的（不区分大小写）
-        seen = set()
-        unique_processes = []
-        for proc in monitored_processes:
-            proc_lower = proc.lower()
-            if proc_lower not in seen:
-                seen.add(proc_lower)
-                unique_processes.append(proc)
+        keys = list(map(str.lower, monitored_processes))
+        first_seen = dict(zip(reversed(keys), reversed(monitored_processes)))
+        unique_processes = [first_seen[key] for key in dict.fromkeys(keys)]
         
         self.monitored_table.setRowCount(len(unique_processes))
         for i, process_name in enumerate(unique_processes):
-            name_item = QTableWidgetItem(process_name)
-            self.monitored_table.setItem(i, 0, name_item)
+            self.monitored_table.setItem(i, 0, self._make_monitored_item(process_name))
+        self._rebuild_monitored_names()
+    
+    def _rebuild_monitored_names(self):
+        """根据监控表格重建监控进程名快照（界面线程调用）"""
+        names = set()
+        for i in range(self.monitored_table.rowCount()):
+            name_item = self.monitored_table.item(i, 0)
+            if name_item:
+                names.add(name_item.data(Qt.ItemDataRole.UserRole))
+        with self._monitored_names_lock:
+            self._monitored_names = frozenset(names)
+    
+    def _get_monitored_names(self) -> frozenset:
+        """获取监控进程名（小写）快照（监测线程调用）"""
+        return self._monitored_names
+    
+    @staticmethod
+    def _make_monitored_item(name: str) -> QTableWidgetItem:
+        """创建监控表格项，小写进程名存入 UserRole，比较时不再重复转换"""
+        item = QTableWidgetItem(name)
+        item.setData(Qt.ItemDataRole.UserRole, name.lower())
+        return item
+    
+    def on_monitored_item_changed(self, item: QTableWidgetItem):
+        """监控表格项被编辑时同步小写进程名和监控快照"""
+        name_lower = item.text().lower()
+        if item.data(Qt.ItemDataRole.UserRole) != name_lower:
+            item.setData(Qt.ItemDataRole.UserRole, name_lower)
+            self._rebuild_monitored_names()
+    
+    def _is_monitored(self, name_lower: str) -> bool:
+        """进程名（小写）是否已在监控表格中"""
+        for i in range(self.monitored_table.rowCount()):
+            name_item = self.monitored_table.item(i, 0)
+            if name_item and name_item.data(Qt.ItemDataRole.UserRole) == name_lower:
+                return True
+        return False
     
     def save_config(self):
         """保存配置"""
@@ -227,18 +534,15 @@ class MonitorWindow(QMainWindow):
             return
         
         # 检查是否已存在（不区分大小写）
-        process_name_lower = process_name.lower()
-        for i in range(self.monitored_table.rowCount()):
-            name_item = self.monitored_table.item(i, 0)
-            if name_item and name_item.text().lower() == process_name_lower:
-                QMessageBox.information(self, "提示", "该进程已在监控列表中")
-                return
+        if self._is_monitored(process_name.lower()):
+            QMessageBox.information(self, "提示", "该进程已在监控列表中")
+            return
         
         # 添加新行
         row = self.monitored_table.rowCount()
         self.monitored_table.insertRow(row)
-        name_item = QTableWidgetItem(process_name)
-        self.monitored_table.setItem(row, 0, name_item)
+        self.monitored_table.setItem(row, 0, self._make_monitored_item(process_name))
+        self._rebuild_monitored_names()
         
         self.process_name_input.clear()
     
@@ -258,20 +562,16 @@ class MonitorWindow(QMainWindow):
         # 从后往前删除，避免索引变化
         for row in sorted(selected_rows, reverse=True):
             self.monitored_table.removeRow(row)
+        self._rebuild_monitored_names()
     
-    def on_running_table_double_clicked(self, item):
+    def on_running_list_double_clicked(self, index: QModelIndex):
         """双击运行列表项，添加到监控列表"""
-        row = item.row()
-        self._add_process_to_monitor(row)
+        self._add_process_to_monitor(index.row())
     
     def add_to_monitor(self):
         """从运行列表添加到监控列表（支持多选）"""
         # 获取所有选中的行
-        selected_rows = []
-        if self.running_table.selectionModel():
-            selected_indexes = self.running_table.selectionModel().selectedRows()
-            for index in selected_indexes:
-                selected_rows.append(index.row())
+        selected_rows = [index.row() for index in self.running_list.selectionModel().selectedIndexes()]
         
         if not selected_rows:
             QMessageBox.warning(self, "警告", "请先选择要监控的进程")
@@ -288,124 +588,87 @@ class MonitorWindow(QMainWindow):
     
     def _add_process_to_monitor(self, row, show_message=True):
         """添加指定行的进程到监控列表"""
-        name_item = self.running_table.item(row, 0)
-        if not name_item:
-            return False
-        
-        name = name_item.text()
-        name_lower = name.lower()
+        name = self.running_model.name(row)
         
         # 检查是否已存在（不区分大小写）
-        for i in range(self.monitored_table.rowCount()):
-            existing_item = self.monitored_table.item(i, 0)
-            if existing_item and existing_item.text().lower() == name_lower:
-                if show_message:
-                    QMessageBox.information(self, "提示", f"进程 '{name}' 已在监控列表中")
-                return False
+        if self._is_monitored(self.running_model.key(row)):
+            if show_message:
+                QMessageBox.information(self, "提示", f"进程 '{name}' 已在监控列表中")
+            return False
         
         # 添加新行
         new_row = self.monitored_table.rowCount()
         self.monitored_table.insertRow(new_row)
-        new_item = QTableWidgetItem(name)
-        self.monitored_table.setItem(new_row, 0, new_item)
+        self.monitored_table.setItem(new_row, 0, self._make_monitored_item(name))
+        self._rebuild_monitored_names()
         return True
     
+    def _start_scanner(self):
+        """创建后台扫描线程"""
+        self.scan_thread = QThread(self)
+        self.scanner = ProcessScanner(self.collector)
+        self.scanner.moveToThread(self.scan_thread)
+        self.scan_requested.connect(self.scanner.do_scan)
+        self.scanner.scanned.connect(self.on_scan_result)
+        self.scanner.failed.connect(self.on_scan_failed)
+        self.scan_thread.start()
+    
     def start_refresh_timer(self):
-        """启动刷新定时器"""
-        self.refresh_timer = QTimer()
+        """
+        启动刷新定时器
+        
+        单次定时器，每次扫描结束后按剩余时间重新安排下一次，
+        扫描较慢时不会在扫描线程上堆积请求
+        """
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
         self.refresh_timer.timeout.connect(self.refresh_running_processes)
-        self.refresh_timer.start(2000)  # 每2秒刷新一次
         # 延迟首次刷新
-        QTimer.singleShot(500, self.refresh_running_processes)
+        self.refresh_timer.start(500)
+    
+    def _schedule_refresh(self, delay_ms: int):
+        """安排下一次刷新（最小化时不安排，恢复时由 changeEvent 立即刷新）"""
+        if self.refresh_timer is not None and not self.isMinimized():
+            self.refresh_timer.start(max(self.MIN_REFRESH_DELAY_MS, delay_ms))
+    
+    def _schedule_next_scan(self):
+        """扫描结束后安排下一次刷新，间隔从本次扫描开始计"""
+        self._scan_in_flight = False
+        elapsed_ms = int((time.monotonic() - self._scan_started) * 1000)
+        self._schedule_refresh(self.REFRESH_INTERVAL_MS - elapsed_ms)
     
     def refresh_running_processes(self):
-        """增量刷新运行中的进程列表（按进程名去重）"""
-        if self.monitoring or self.collector is None:
+        """增量刷新运行中的进程列表（扫描在后台线程进行，结果由 on_scan_result 应用）"""
+        if self.collector is None or self._scan_in_flight:
             return
-        
+        # 监测中不刷新；窗口隐藏、最小化或列表不可见时没有人看，跳过扫描
+        if (self.monitoring or not self.isVisible() or self.isMinimized()
+                or self.running_list.visibleRegion().isEmpty()):
+            self._schedule_refresh(self.REFRESH_INTERVAL_MS)
+            return
+        self._scan_in_flight = True
+        self._scan_started = time.monotonic()
+        self.scan_requested.emit()
+    
+    def on_scan_result(self, entries: List[Tuple[str, str]]):
+        """应用后台扫描结果（主线程）"""
+        self._schedule_next_scan()
+        if self.monitoring:
+            return
+        # 模型只对变化的区间增删行，选中状态由视图自动保留；
+        # 增删期间暂停重绘并屏蔽选择模型信号，结束后统一刷新一次
+        view = self.running_list
+        blocker = QSignalBlocker(view.selectionModel())
+        view.setUpdatesEnabled(False)
         try:
-            # 保存当前选中状态（按进程名）
-            selected_names = set()
-            if self.running_table.selectionModel():
-                selected_indexes = self.running_table.selectionModel().selectedRows()
-                for index in selected_indexes:
-                    name_item = self.running_table.item(index.row(), 0)
-                    if name_item:
-                        selected_names.add(name_item.text().lower())
-            
-            # 获取新进程列表
-            new_processes = self.collector.get_process_list_fast()
-            
-            # 按进程名去重（不区分大小写），保留第一个
-            process_names_seen = {}
-            for proc in new_processes:
-                name_lower = proc.name.lower()
-                if name_lower not in process_names_seen:
-                    process_names_seen[name_lower] = proc.name
-            
-            # 获取去重后的进程名列表并排序
-            unique_names = sorted(process_names_seen.values(), key=lambda n: n.lower())
-            
-            # 创建当前表格中的进程名集合（不区分大小写）
-            current_names = set()
-            for row in range(self.running_table.rowCount()):
-                name_item = self.running_table.item(row, 0)
-                if name_item:
-                    current_names.add(name_item.text().lower())
-            
-            # 找出需要删除的进程名（旧的有，新的没有）
-            names_to_remove = current_names - set(n.lower() for n in unique_names)
-            
-            # 找出需要添加的进程名（新的有，旧的没有）
-            names_to_add = set(n.lower() for n in unique_names) - current_names
-            
-            # 禁用排序，避免更新时自动排序
-            was_sorting_enabled = self.running_table.isSortingEnabled()
-            self.running_table.setSortingEnabled(False)
-            
-            # 删除不存在的进程
-            rows_to_remove = []
-            for row in range(self.running_table.rowCount()):
-                name_item = self.running_table.item(row, 0)
-                if name_item and name_item.text().lower() in names_to_remove:
-                    rows_to_remove.append(row)
-            
-            # 从后往前删除，避免索引变化
-            for row in reversed(rows_to_remove):
-                self.running_table.removeRow(row)
-            
-            # 添加新进程（插入到合适位置保持排序）
-            for name in unique_names:
-                if name.lower() in names_to_add:
-                    # 找到插入位置（保持按进程名排序）
-                    insert_row = self.running_table.rowCount()
-                    for row in range(self.running_table.rowCount()):
-                        name_item = self.running_table.item(row, 0)
-                        if name_item and name_item.text().lower() > name.lower():
-                            insert_row = row
-                            break
-                    
-                    self.running_table.insertRow(insert_row)
-                    name_item = QTableWidgetItem(name)
-                    self.running_table.setItem(insert_row, 0, name_item)
-            
-            # 恢复排序
-            self.running_table.setSortingEnabled(was_sorting_enabled)
-            
-            # 恢复选中状态（按进程名）
-            if selected_names:
-                for row in range(self.running_table.rowCount()):
-                    name_item = self.running_table.item(row, 0)
-                    if name_item and name_item.text().lower() in selected_names:
-                        self.running_table.selectRow(row)
-            
-            # 更新当前进程字典（按进程名）
-            self.current_processes = {name.lower(): name for name in unique_names}
-            
-        except Exception as e:
-            import traceback
-            print(f"刷新进程列表时出错: {e}")
-            traceback.print_exc()
+            self.running_model.set_entries(entries)
+        finally:
+            view.setUpdatesEnabled(True)
+            blocker.unblock()
+    
+    def on_scan_failed(self, message: str):
+        """后台扫描失败（主线程），按正常间隔重试"""
+        self._schedule_next_scan()
     
     def toggle_monitoring(self):
         """切换监测状态"""
@@ -419,6 +682,10 @@ class MonitorWindow(QMainWindow):
         if self.collector is None:
             QMessageBox.warning(self, "警告", "采集器尚未初始化，请稍候再试")
             return
+        # 上一次的监测线程还在结束当前采样（开始按钮此时不可用），
+        # 两个线程不能同时使用同一个采集器
+        if self.monitor_thread is not None:
+            return
         
         self.save_config()
         
@@ -444,97 +711,69 @@ class MonitorWindow(QMainWindow):
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.status_label.setText(f"状态: 监测中 - 数据库: {db_filename}")
-        self.last_record_time = None
-        self.last_record_label.setText("最新记录时间: 等待中...")
-        
-        # 启动更新时间的定时器（每秒更新一次）
-        self.update_time_timer.start(1000)
-        
-        self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
+        self.last_record_label.start()
+        
+        self._stop_event = threading.Event()
+        self.monitor_worker = MonitorWorker(
+            self.collector, self.db_manager, self.interval_spin.value(),
+            self._get_monitored_names, self._stop_event
+        )
+        self.monitor_thread = QThread(self)
+        self.monitor_worker.moveToThread(self.monitor_thread)
+        self.monitor_thread.started.connect(self.monitor_worker.run)
+        self.monitor_worker.record_written.connect(
+            self.last_record_label.set_reference, Qt.ConnectionType.QueuedConnection
+        )
+        self.monitor_worker.error.connect(self.on_monitor_error, Qt.ConnectionType.QueuedConnection)
+        self.monitor_worker.finished.connect(self.monitor_thread.quit)
+        self.monitor_thread.finished.connect(
+            self.on_monitor_thread_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self.monitor_thread.finished.connect(self.monitor_worker.deleteLater)
+        self.monitor_thread.finished.connect(self.monitor_thread.deleteLater)
         self.monitor_thread.start()
     
     def stop_monitoring(self):
-        """停止监测"""
+        """
+        停止监测
+        
+        监测线程在当前采样结束后退出并关闭数据库；线程结束前开始按钮保持不可用，
+        由 on_monitor_thread_finished 恢复
+        """
         self.monitoring = False
-        self.start_btn.setEnabled(True)
+        self._stop_event.set()
         self.stop_btn.setEnabled(False)
-        self.status_label.setText("状态: 已停止")
-        self.update_time_timer.stop()
-        self.last_record_label.setText("")
-        
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=2)
-    
-    def update_last_record_time(self):
-        """更新最新记录时间显示"""
-        if self.last_record_time:
-            from datetime import datetime
-            now = datetime.now()
-            elapsed = (now - self.last_record_time).total_seconds()
-            time_str = self.last_record_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.last_record_label.setText(f"最新记录时间: {time_str} ({elapsed:.0f}秒前)")
-        else:
-            self.last_record_label.setText("最新记录时间: 等待中...")
-    
-    def monitor_loop(self):
-        """监测循环（按进程名监控，不区分大小写）"""
-        interval = self.interval_spin.value()
-        
-        # 获取要监控的进程名列表（不区分大小写）
-        monitored_names = set()
-        for i in range(self.monitored_table.rowCount()):
-            name_item = self.monitored_table.item(i, 0)
-            if name_item:
-                monitored_names.add(name_item.text().lower())
+        self.status_label.setText("状态: 正在停止...")
+        self.last_record_label.stop()
         
-        # 初始化所有进程的CPU使用率（非阻塞模式需要先初始化）
-        import psutil
-        try:
-            # 初始化系统CPU
-            psutil.cpu_percent(interval=None)
-            
-            # 初始化所有监控进程的CPU
-            for name_lower in monitored_names:
-                procs = self.collector.get_processes_by_name(name_lower)
-                for proc_info in procs:
-                    try:
-                        proc = psutil.Process(proc_info.pid)
-                        proc.cpu_percent(interval=None)  # 初始化，建立基准
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        continue
-        except Exception as e:
-            print(f"初始化CPU使用率时出错: {e}")
-        
-        # 等待一个间隔，让CPU数据有值
-        time.sleep(interval)
+        if self.monitor_thread is not None:
+            self.monitor_thread.quit()
+            if not self.monitor_thread.wait(2000):
+                print("监测线程未能在 2 秒内退出，将在当前采样结束后关闭数据库")
         
-        while self.monitoring:
-            try:
-                processes_to_record = []
-                
-                # 按进程名获取所有匹配的进程（不区分大小写）
-                for name_lower in monitored_names:
-                    # 获取所有同名进程（包括新启动的）
-                    procs = self.collector.get_processes_by_name(name_lower)
-                    processes_to_record.extend(procs)
-                
-                # 记录进程数据
-                if processes_to_record:
-                    for proc_info in processes_to_record:
-                        self.db_manager.insert_process_info(proc_info)
-                
-                # 记录系统数据
-                system_info = self.collector.get_system_info()
-                self.db_manager.insert_system_info(system_info)
-                
-                # 更新最新记录时间
-                from datetime import datetime
-                self.last_record_time = datetime.now()
-                
-                time.sleep(interval)
-            except Exception as e:
-                print(f"监测错误: {e}")
-                time.sleep(interval)
+        # 数据库由监测线程在退出时关闭
+        self.db_manager = None
+    
+    def on_monitor_thread_finished(self):
+        """监测线程已结束（主线程）：释放线程引用，允许重新开始监测"""
+        self.monitor_thread = None
+        self.monitor_worker = None
+        if not self.monitoring:
+            self.start_btn.setEnabled(True)
+            self.status_label.setText("状态: 已停止")
+    
+    def on_monitor_error(self, message: str):
+        """监测线程采样出错（主线程）"""
+        print(f"监测错误: {message}")
+    
+    def changeEvent(self, event):
+        """窗口状态变化：最小化时停止刷新定时器，恢复时立即刷新并重启定时器"""
+        if event.type() == QEvent.Type.WindowStateChange and self.refresh_timer is not None:
+            if self.isMinimized():
+                self.refresh_timer.stop()
+            elif not self.refresh_timer.isActive():
+                self.refresh_running_processes()
+        super().changeEvent(event)
     
     def closeEvent(self, event):
         """关闭事件"""
@@ -549,5 +788,13 @@ class MonitorWindow(QMainWindow):
             
             self.stop_monitoring()
         
+        # 监测线程仍在结束当前采样时等待其退出，窗口销毁时不能带着运行中的子线程
+        if self.monitor_thread is not None:
+            self.monitor_thread.wait()
+        
+        if self.scan_thread is not None:
+            self.scan_thread.quit()
+            self.scan_thread.wait()
+        
         self.save_config()
         event.accept()
@@ -1,5 +1,6 @@
 """平台工具函数"""
 import platform
+from datetime import datetime
 from enum import Enum
 
 
@@ -10,8 +11,8 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
-def get_platform() -> Platform:
-    """获取当前操作系统平台"""
+def _detect() -> Platform:
+    """检测当前操作系统平台"""
     system = platform.system().lower()
     if system == "windows":
         return Platform.WINDOWS
@@ -21,8 +22,15 @@ def get_platform() -> Platform:
         return Platform.UNKNOWN
 
 
+# 运行期间平台不会变化，模块加载时检测一次
+_PLATFORM = _detect()
+
+
+def get_platform() -> Platform:
+    """获取当前操作系统平台"""
+    return _PLATFORM
+
+
 def get_timestamp_string() -> str:
     """获取时间戳字符串（到秒），格式：YYYYMMDD_HHMMSS"""
-    from datetime import datetime
     return datetime.now().strftime("%Y%m%d_%H%M%S")
-